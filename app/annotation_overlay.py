@@ -7,6 +7,7 @@ consistent with the fractional (0.0-1.0) annotation coordinates regardless of
 whether the page is portrait or landscape.
 """
 import math
+from functools import lru_cache
 from typing import List, Optional, Tuple
 
 from PySide6.QtCore import QPoint, QRect, Qt
@@ -65,66 +66,154 @@ def draw_annotations(pixmap: QPixmap, annotations: List[Annotation], page: int,
     return result
 
 
+def redraw_region(base: QPixmap, raw: QPixmap, annotations: List[Annotation],
+                  page: int, rect: QRect,
+                  skip_index: int = -1,
+                  fade_index: int = -1) -> None:
+    """Repaint *rect* (logical px) of *base* **in place** from *raw* + annotations.
+
+    Only annotations whose bounds intersect *rect* are drawn, clipped to it,
+    so the result matches a full ``draw_annotations`` inside *rect*.
+    """
+    painter = QPainter(base)
+    painter.setClipRect(rect)
+    painter.drawPixmap(0, 0, raw)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    dpr = base.devicePixelRatio()
+    w = base.width() / dpr
+    h = base.height() / dpr
+    for i, ann in enumerate(annotations):
+        if ann.page != page or i == skip_index:
+            continue
+        if not annotation_bounds(ann, w, h).intersects(rect):
+            continue
+        if i == fade_index:
+            painter.setOpacity(0.5)
+        _draw_one(painter, ann, int(ann.x * w), int(ann.y * h), w, h)
+        if i == fade_index:
+            painter.setOpacity(1.0)
+    painter.end()
+
+
+def annotation_bounds(ann: Annotation, img_width: float, img_height: float) -> QRect:
+    """Return a rect (logical px) enclosing everything ``_draw_one`` paints for *ann*."""
+    w, h = img_width, img_height
+    s = h / BASE_PAGE_HEIGHT
+    # Widest pen plus a resize handle, with a pixel of antialiasing slack
+    pad = max(2, round(3 * s)) + max(4, round(_RESIZE_HANDLE * s)) + 2
+    cx, cy = int(ann.x * w), int(ann.y * h)
+    if ann.type in ("checkmark", "cross", "tilde"):
+        reach = max(max(2, round(_CHECKMARK_RADIUS * s)), max(20, round(36 * s)) // 2)
+        return QRect(cx - reach, cy - reach, 2 * reach, 2 * reach).adjusted(-pad, -pad, pad, pad)
+    if ann.type == "text":
+        rect = get_text_box_rect(ann, w, h)
+        return rect.adjusted(-2, -2, 2, 2) if rect is not None else QRect()
+    if ann.x2 is not None and ann.y2 is not None:
+        x2, y2 = int(ann.x2 * w), int(ann.y2 * h)
+        pad += max(4, round(MARKER_RADIUS * s))  # arrowhead
+        return QRect(QPoint(min(cx, x2), min(cy, y2)),
+                     QPoint(max(cx, x2), max(cy, y2))).adjusted(-pad, -pad, pad, pad)
+    return QRect()
+
+
 _PREVIEW_OPACITY = 0.6   # opacity for all annotation previews (marker + shape)
 
 
-def draw_marker_preview(
-    pixmap: QPixmap,
-    tool: str,
-    pos: Tuple[float, float],
-) -> None:
-    """Draw a semi-transparent ghost of a point marker (checkmark/cross/tilde)
-    on *pixmap* **in place** at _PREVIEW_OPACITY."""
-    painter = QPainter(pixmap)
+@lru_cache(maxsize=16)
+def marker_ghost(tool: str, page_h: int, dpr: float) -> Tuple[QPixmap, int]:
+    """Return a small transparent pixmap holding the ghost of a point marker.
+
+    The marker is centred in the pixmap; the second value is the logical
+    half-size, i.e. the offset from the pixmap's top-left to the marker centre.
+    """
+    s = page_h / BASE_PAGE_HEIGHT
+    reach = max(max(2, round(_CHECKMARK_RADIUS * s)), max(20, round(36 * s)) // 2)
+    half = reach + max(2, round(3 * s)) + 1
+    pm = QPixmap(round(2 * half * dpr), round(2 * half * dpr))
+    pm.setDevicePixelRatio(dpr)
+    pm.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pm)
     painter.setRenderHint(QPainter.RenderHint.Antialiasing)
     painter.setOpacity(_PREVIEW_OPACITY)
-    dpr = pixmap.devicePixelRatio()
-    w = pixmap.width() / dpr
-    h = pixmap.height() / dpr
-    ann = Annotation(page=0, type=tool, x=pos[0], y=pos[1])
-    cx = int(pos[0] * w)
-    cy = int(pos[1] * h)
-    _draw_one(painter, ann, cx, cy, w, h)
+    _draw_one(painter, Annotation(page=0, type=tool, x=0.0, y=0.0),
+              half, half, page_h, page_h)
     painter.end()
+    return pm, half
 
 
-def draw_preview(
-    pixmap: QPixmap,
+def preview_bounds(
     tool: str,
     start: Tuple[float, float],
     end: Tuple[float, float],
+    w: float,
+    h: float,
+) -> QRect:
+    """Return the logical-pixel rect that ``paint_preview`` may touch."""
+    s = h / BASE_PAGE_HEIGHT
+    pad = max(4, round(MARKER_RADIUS * s)) + max(1, round(2 * s)) + 1
+    x1, y1 = int(start[0] * w), int(start[1] * h)
+    x2, y2 = int(end[0] * w), int(end[1] * h)
+    return QRect(QPoint(min(x1, x2), min(y1, y2)),
+                 QPoint(max(x1, x2), max(y1, y2))).adjusted(-pad, -pad, pad, pad)
+
+
+def paint_preview(
+    painter: QPainter,
+    tool: str,
+    start: Tuple[float, float],
+    end: Tuple[float, float],
+    w: float,
+    h: float,
 ) -> None:
-    """Draw a semi-transparent solid ghost shape on *pixmap* **in place** (modifies the pixmap)."""
-    painter = QPainter(pixmap)
+    """Paint the ghost shape with *painter* on a page of logical size *w*×*h*."""
+    paint = _PREVIEW_PAINTERS.get(tool)
+    if paint is None:
+        return
+    painter.save()
     painter.setRenderHint(QPainter.RenderHint.Antialiasing)
     painter.setOpacity(_PREVIEW_OPACITY)
-    dpr = pixmap.devicePixelRatio()
-    w = pixmap.width() / dpr
-    h = pixmap.height() / dpr
     s = h / BASE_PAGE_HEIGHT
-    x1, y1 = int(start[0] * w), int(start[1] * h)
-    x2, y2 = int(end[0] * w), int(end[1] * h)
+    painter.setPen(_preview_pen(max(1, round(2 * s))))
+    paint(painter,
+          int(start[0] * w), int(start[1] * h),
+          int(end[0] * w), int(end[1] * h), s)
+    painter.restore()
 
-    pen_w = max(1, round(2 * s))
-    pen = QPen(_RED, pen_w, Qt.PenStyle.SolidLine)
-    painter.setPen(pen)
-    if tool == "line":
-        painter.drawLine(x1, y1, x2, y2)
-    elif tool == "arrow":
-        _draw_arrow(painter, x1, y1, x2, y2, s)
-    elif tool == "ellipse":
-        # Ellipse inscribed in the bounding rectangle defined by start/end
-        painter.setBrush(Qt.BrushStyle.NoBrush)
-        left, right = min(x1, x2), max(x1, x2)
-        top, bottom = min(y1, y2), max(y1, y2)
-        if right - left > 0 and bottom - top > 0:
-            painter.drawEllipse(left, top, right - left, bottom - top)
-    elif tool == "rectcross":
-        # Preview: diagonals of the rectangle (no rectangle border)
-        painter.drawLine(x1, y1, x2, y2)
-        painter.drawLine(x2, y1, x1, y2)
 
-    painter.end()
+@lru_cache(maxsize=8)
+def _preview_pen(width: int) -> QPen:
+    return QPen(_RED, width, Qt.PenStyle.SolidLine)
+
+
+def _preview_line(painter: QPainter, x1: int, y1: int, x2: int, y2: int, s: float):
+    painter.drawLine(x1, y1, x2, y2)
+
+
+def _preview_arrow(painter: QPainter, x1: int, y1: int, x2: int, y2: int, s: float):
+    _draw_arrow(painter, x1, y1, x2, y2, s)
+
+
+def _preview_ellipse(painter: QPainter, x1: int, y1: int, x2: int, y2: int, s: float):
+    # Ellipse inscribed in the bounding rectangle defined by start/end
+    painter.setBrush(Qt.BrushStyle.NoBrush)
+    left, right = min(x1, x2), max(x1, x2)
+    top, bottom = min(y1, y2), max(y1, y2)
+    if right - left > 0 and bottom - top > 0:
+        painter.drawEllipse(left, top, right - left, bottom - top)
+
+
+def _preview_rectcross(painter: QPainter, x1: int, y1: int, x2: int, y2: int, s: float):
+    # Preview: diagonals of the rectangle (no rectangle border)
+    painter.drawLine(x1, y1, x2, y2)
+    painter.drawLine(x2, y1, x1, y2)
+
+
+_PREVIEW_PAINTERS = {
+    "line": _preview_line,
+    "arrow": _preview_arrow,
+    "ellipse": _preview_ellipse,
+    "rectcross": _preview_rectcross,
+}
 
 
 def get_text_box_rect(ann: Annotation, img_width: int, img_height: int) -> Optional[QRect]:
@@ -147,9 +236,12 @@ def find_annotation_at(
     tolerance_px: int = 20,
 ) -> int:
     """Return the index of the annotation nearest to *(px, py)* on *page*, or -1."""
+    mx, my = px * img_width, py * img_height
     for i, ann in enumerate(annotations):
         if ann.page != page:
             continue
+        if not may_hit(ann, mx, my, img_width, img_height, tolerance_px):
+            continue
         if ann.type in ("line", "arrow") and ann.x2 is not None and ann.y2 is not None:
             dist = _pt_seg_dist(
                 px * img_width, py * img_height,
@@ -194,12 +286,52 @@ def find_annotation_at(
     return -1
 
 
+def hit_box(ann: Annotation, img_width: float, img_height: float,
+            pad: float) -> Tuple[float, float, float, float]:
+    """Return *(left, top, right, bottom)* px outside which *ann* cannot be hit.
+
+    The ``annotation_bounds`` rect grown by *pad*; ellipses get an unbounded
+    box because their perimeter tolerance scales with the aspect ratio.
+    """
+    if ann.type == "ellipse":
+        inf = float("inf")
+        return -inf, -inf, inf, inf
+    r = annotation_bounds(ann, img_width, img_height)
+    if r.isEmpty():
+        r = QRect(int(ann.x * img_width), int(ann.y * img_height), 1, 1)
+    return r.left() - pad, r.top() - pad, r.right() + pad, r.bottom() + pad
+
+
+def may_hit(ann: Annotation, mx: float, my: float,
+            img_width: float, img_height: float, tol: float) -> bool:
+    """Cheap bounding-box pre-check for hit tests at pixel *(mx, my)*.
+
+    *False* means nothing of *ann* (stroke, handle or text box) lies within
+    *tol* of the point; *True* means the exact test still has to run.
+    """
+    x0, y0, x1, y1 = hit_box(ann, img_width, img_height, tol)
+    return x0 <= mx <= x1 and y0 <= my <= y1
+
+
 # ── Internal helpers ──────────────────────────────────────────────────────────
 
+@lru_cache(maxsize=32)
+def _text_font(point_size: int) -> QFont:
+    """Bold text-annotation font at *point_size* (shared — do not mutate)."""
+    font = QFont()
+    font.setPointSize(point_size)
+    font.setBold(True)
+    return font
+
+
+@lru_cache(maxsize=512)
 def _text_box_size(text: str, width_frac: Optional[float],
                    img_width: int, img_height: int) -> Tuple[int, int]:
     """Return *(width_px, height_px)* for a text annotation box.
 
+    Memoised: hit tests call this for every text annotation under the
+    pointer, and the result only changes with the text, width or zoom.
+
     All sizes scale with *img_height* so the box appears the same physical
     size relative to the page regardless of zoom level.
 
@@ -207,10 +339,7 @@ def _text_box_size(text: str, width_frac: Optional[float],
     so that all text is visible regardless of how much content there is.
     """
     s = img_height / BASE_PAGE_HEIGHT
-    font = QFont()
-    font.setPointSize(max(4, round(_TEXT_FONT_PT * s)))
-    font.setBold(True)
-    fm = QFontMetrics(font)
+    fm = QFontMetrics(_text_font(max(4, round(_TEXT_FONT_PT * s))))
     p = max(1, round(_TEXT_PAD * s))
 
     if width_frac is not None:
@@ -267,10 +396,7 @@ def _draw_one(painter: QPainter, ann: Annotation, cx: int, cy: int, w: int, h: i
         painter.drawPath(path)
 
     elif ann.type == "text" and ann.text:
-        font = QFont()
-        font.setPointSize(max(4, round(_TEXT_FONT_PT * s)))
-        font.setBold(True)
-        painter.setFont(font)
+        painter.setFont(_text_font(max(4, round(_TEXT_FONT_PT * s))))
         p = max(1, round(_TEXT_PAD * s))
         bw, bh = _text_box_size(ann.text, ann.width, w, h)
         bg = QRect(cx, cy, bw, bh)
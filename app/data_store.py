@@ -1,5 +1,6 @@
 """Data persistence: load/save grades, annotations, session config."""
 import csv
+import hashlib
 import json
 import os
 import tempfile
@@ -60,16 +61,43 @@ ANNOTATIONS_DIR: str = ""
 EXPORT_DIR: str = ""
 ANNOTATED_EXPORT_DIR: str = ""
 ANNOTATED_LOGS_DIR: str = ""
+PAGE_CACHE_DIR: str = ""
+
+# Upper bound for the on-disk page raster cache.  Unlike the in-memory page
+# cache (GradingSettings.page_cache_mb) this is not user-configurable; the
+# cache lives in the per-user cache folder, outside the project.
+PAGE_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# Limits for GradingSettings.page_cache_mb (in-memory page cache).  The
+# minimum holds the current page plus a neighbour at hi-DPR and high zoom.
+PAGE_CACHE_MB_MIN = 160
+PAGE_CACHE_MB_MAX = 2048
+PAGE_CACHE_MB_DEFAULT = GradingSettings.page_cache_mb
+
+
+def _user_cache_dir() -> str:
+    """Return the per-user cache folder (QStandardPaths CacheLocation)."""
+    try:
+        from PySide6.QtCore import QStandardPaths
+        path = QStandardPaths.writableLocation(
+            QStandardPaths.StandardLocation.CacheLocation)
+        if path:
+            return path
+    except ImportError:
+        pass
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "exam-grader")
 
 
 def set_project_dir(project_dir: str) -> None:
     """Configure all data paths to use *project_dir* as the root."""
     global _active_project_dir, DATA_DIR, GRADES_PATH, ANNOTATIONS_DIR
-    global EXPORT_DIR, ANNOTATED_EXPORT_DIR, ANNOTATED_LOGS_DIR
+    global EXPORT_DIR, ANNOTATED_EXPORT_DIR, ANNOTATED_LOGS_DIR, PAGE_CACHE_DIR
     _active_project_dir = os.path.abspath(project_dir)
     DATA_DIR = os.path.join(_active_project_dir, "data")
     GRADES_PATH = os.path.join(DATA_DIR, "grades.json")
     ANNOTATIONS_DIR = os.path.join(DATA_DIR, "annotations")
+    PAGE_CACHE_DIR = os.path.join(_user_cache_dir(), "page_cache")
     EXPORT_DIR = os.path.join(_active_project_dir, "export")
     ANNOTATED_EXPORT_DIR = os.path.join(EXPORT_DIR, "annotated")
     ANNOTATED_LOGS_DIR = os.path.join(ANNOTATED_EXPORT_DIR, "logs")
@@ -80,6 +108,7 @@ def set_project_dir(project_dir: str) -> None:
     dbg(f"  EXPORT_DIR       = {EXPORT_DIR}")
     dbg(f"  ANNOTATED_EXPORT = {ANNOTATED_EXPORT_DIR}")
     dbg(f"  ANNOTATED_LOGS   = {ANNOTATED_LOGS_DIR}")
+    dbg(f"  PAGE_CACHE_DIR   = {PAGE_CACHE_DIR}")
 
 
 def get_project_dir() -> Optional[str]:
@@ -124,6 +153,60 @@ def _atomic_json_write(path: str, data) -> None:
         raise
 
 
+# ── Rendered-page disk cache ──────────────────────────────────────────────────
+
+def page_cache_key(pdf_path: str) -> Optional[str]:
+    """Return a cache key identifying this version of *pdf_path*, or None.
+
+    The key changes whenever the file is replaced or modified, so stale
+    rasters are never reused.  None means no project is open.
+    """
+    if not PAGE_CACHE_DIR:
+        return None
+    try:
+        st = os.stat(pdf_path)
+    except OSError:
+        return None
+    ident = f"{os.path.abspath(pdf_path)}:{st.st_size}:{st.st_mtime_ns}"
+    return hashlib.sha1(ident.encode("utf-8")).hexdigest()
+
+
+def page_cache_file(key: str, page: int, zoom: float, dpr: float) -> str:
+    """Return the cache file path for one rasterised page."""
+    return os.path.join(PAGE_CACHE_DIR, key, f"{page}_{zoom:.3f}_{dpr:.2f}.png")
+
+
+def trim_page_cache(max_bytes: int = PAGE_CACHE_MAX_BYTES) -> None:
+    """Delete the least recently written cached pages beyond *max_bytes*."""
+    if not PAGE_CACHE_DIR or not os.path.isdir(PAGE_CACHE_DIR):
+        return
+    entries = []
+    total = 0
+    for root, _dirs, files in os.walk(PAGE_CACHE_DIR):
+        for name in files:
+            path = os.path.join(root, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+    if total <= max_bytes:
+        return
+    entries.sort()
+    removed = 0
+    for _mtime, size, path in entries:
+        if total <= max_bytes:
+            break
+        try:
+            os.unlink(path)
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    dbg(f"Trimmed {removed} cached page(s) from {PAGE_CACHE_DIR}")
+
+
 # ── Session config ────────────────────────────────────────────────────────────
 
 def load_session_config() -> Optional[dict]:
@@ -158,6 +241,7 @@ def _default_config() -> dict:
             "debug_mode": False,
             "cover_page_detail": False,
             "hi_dpr": False,
+            "page_cache_mb": PAGE_CACHE_MB_DEFAULT,
             "grading_separate_window": False,
             "show_extra_fields": False,
             "compact_table": False,
@@ -268,6 +352,15 @@ def load_grading_scheme_from_config(config_data: dict) -> GradingScheme:
     return scheme
 
 
+def _parse_page_cache_mb(raw) -> int:
+    """Return a valid page cache budget (MB) from a config value, or the default."""
+    try:
+        mb = int(raw)
+    except (TypeError, ValueError):
+        return PAGE_CACHE_MB_DEFAULT
+    return max(PAGE_CACHE_MB_MIN, min(PAGE_CACHE_MB_MAX, mb))
+
+
 def load_grading_settings_from_config(config_data: dict) -> GradingSettings:
     """Build a GradingSettings from a parsed config dict."""
     gs = config_data.get("grading_settings", {})
@@ -279,6 +372,7 @@ def load_grading_settings_from_config(config_data: dict) -> GradingSettings:
         debug_mode=bool(gs.get("debug_mode", False)),
         cover_page_detail=bool(gs.get("cover_page_detail", False)),
         hi_dpr=bool(gs.get("hi_dpr", False)),
+        page_cache_mb=_parse_page_cache_mb(gs.get("page_cache_mb")),
         grading_separate_window=bool(gs.get("grading_separate_window", False)),
         show_extra_fields=bool(gs.get("show_extra_fields", False)),
         compact_table=bool(gs.get("compact_table", False)),
@@ -299,6 +393,7 @@ def save_grading_settings_to_config(config_data: dict, settings: GradingSettings
         "debug_mode": settings.debug_mode,
         "cover_page_detail": settings.cover_page_detail,
         "hi_dpr": settings.hi_dpr,
+        "page_cache_mb": settings.page_cache_mb,
         "grading_separate_window": settings.grading_separate_window,
         "show_extra_fields": settings.show_extra_fields,
         "compact_table": settings.compact_table,
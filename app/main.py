@@ -1,10 +1,14 @@
 """Main entry point for Exam Grader native app."""
 import csv
 import os
+import string
 import subprocess
 import sys
 import time
-from typing import List, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, List, Optional
 
 import openpyxl
 from openpyxl.utils import get_column_letter
@@ -43,6 +47,10 @@ from undo_redo import (
 # Qt.KeyboardModifier.ControlModifier maps to Cmd on macOS, Ctrl on Win/Linux
 _WIN_MOD = Qt.KeyboardModifier.ControlModifier
 
+# Max. number of serialised annotated PDFs waiting for the background writer
+# during export (bounds memory use).
+_MAX_PENDING_WRITES = 2
+
 
 class _EmptyDefault(dict):
     """dict subclass that returns 'EMPTY' for missing keys."""
@@ -50,6 +58,56 @@ class _EmptyDefault(dict):
         return "EMPTY"
 
 
+_STUDENT_FIELDS = ("student_number", "last_name", "first_name")
+
+
+def _template_fields(student: Student) -> dict:
+    """Return the placeholder values available to the export filename template."""
+    fields = {k: (v if v else "EMPTY") for k, v in student.extra_fields.items()}
+    fields.update(
+        student_number=student.student_number or "EMPTY",
+        last_name=student.last_name or "EMPTY",
+        first_name=student.first_name or "EMPTY",
+    )
+    return fields
+
+
+def _compile_filename_template(template: str) -> Optional[Callable[[Student], str]]:
+    """Parse the export filename *template* once and return a renderer.
+
+    The renderer maps a student to the filename stem, giving the same result
+    as ``template.format_map(_EmptyDefault(_template_fields(student)))``.
+    Templates made only of plain ``{name}`` placeholders are rendered
+    straight from the parsed pieces; anything fancier (format specs,
+    conversions, attribute/index access) falls back to ``format_map``.
+    Returns *None* if the template cannot be parsed.
+    """
+    try:
+        parsed = list(string.Formatter().parse(template))
+    except ValueError:
+        return None
+    if any(name is not None and (not name.isidentifier() or spec or conv)
+           for _, name, spec, conv in parsed):
+        return lambda student: template.format_map(
+            _EmptyDefault(_template_fields(student)))
+
+    pieces = []   # literal strings and per-placeholder value getters
+    for literal, name, _, _ in parsed:
+        if literal:
+            pieces.append(literal)
+        if name is None:
+            continue
+        if name in _STUDENT_FIELDS:
+            pieces.append(lambda st, n=name: getattr(st, n) or "EMPTY")
+        else:
+            pieces.append(lambda st, n=name: st.extra_fields.get(n) or "EMPTY")
+
+    def render(student: Student) -> str:
+        return "".join(p if isinstance(p, str) else p(student) for p in pieces)
+
+    return render
+
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -174,6 +232,7 @@ class MainWindow(QMainWindow):
         self._students = data_store.load_students(os.path.join(project_dir, "students.csv"))
         self._grades = data_store.load_grades()
         data_store.ensure_data_dirs()
+        data_store.trim_page_cache()
         self._undo_manager.set_journal_path(
             os.path.join(data_store.DATA_DIR, "journal.json")
         )
@@ -181,6 +240,7 @@ class MainWindow(QMainWindow):
         self._grading_panel.set_session(self._students, self._grading_scheme, self._grades)
         self._grading_panel.set_grading_settings(self._grading_settings)
         self._pdf_viewer.set_hi_dpr(self._grading_settings.hi_dpr)
+        self._pdf_viewer.set_cache_budget_mb(self._grading_settings.page_cache_mb)
         self._pdf_viewer.set_preset_annotations(self._preset_annotations)
         self._apply_grading_window_mode()
         # Defer splitter fit so table column widths are computed first
@@ -218,6 +278,7 @@ class MainWindow(QMainWindow):
             self._preset_annotations = dlg.get_preset_annotations()
             self._grading_panel.set_grading_settings(self._grading_settings)
             self._pdf_viewer.set_hi_dpr(self._grading_settings.hi_dpr)
+            self._pdf_viewer.set_cache_budget_mb(self._grading_settings.page_cache_mb)
             self._grading_panel.set_session(
                 self._students, self._grading_scheme, self._grades
             )
@@ -522,7 +583,7 @@ class MainWindow(QMainWindow):
             )
 
         output_dir = data_store.ANNOTATED_EXPORT_DIR
-        template = self._export_template
+        render_stem = _compile_filename_template(self._export_template)
         debug = self._grading_settings.debug_mode
 
         os.makedirs(output_dir, exist_ok=True)
@@ -558,63 +619,130 @@ class MainWindow(QMainWindow):
 
         cancel_btn.clicked.connect(on_cancel)
 
-        exported = skipped = 0
-        for i, student in enumerate(self._students):
-            if cancelled:
-                if debug:
-                    print("[Export] Cancelled by user.")
-                break
-            progress_bar.setValue(i)
-            status_label.setText(
-                f"Exporting annotated PDFs… ({i + 1}/{len(self._students)})"
-            )
-            QApplication.processEvents()
-            src = os.path.join(self._exams_dir, f"{student.student_number}.pdf")
-            if not os.path.isfile(src):
-                if debug:
-                    print(f"[Export] SKIP {student.student_number}: PDF not found at {src}")
-                skipped += 1
-                continue
-            anns = data_store.load_annotations(student.student_number)
-
-            fields = {k: (v if v else "EMPTY") for k, v in student.extra_fields.items()}
-            fields.update(
-                student_number=student.student_number or "EMPTY",
-                last_name=student.last_name or "EMPTY",
-                first_name=student.first_name or "EMPTY",
-            )
-            try:
-                stem = template.format_map(_EmptyDefault(fields))
-            except ValueError:
-                stem = f"{student.student_number}_annotated"
-            dst = os.path.join(output_dir, f"{stem}.pdf")
-            log_path = os.path.join(data_store.ANNOTATED_LOGS_DIR, f"{stem}.log") if debug else None
-
-            if debug:
-                print(f"[Export] [{i+1}/{len(self._students)}] {student.student_number} → {dst}")
-                print(f"[Export]   log file → {log_path}")
-
+        # Snapshot the exams directory once instead of stat()-ing every
+        # student's PDF.  Names are student numbers (".pdf" stripped).
+        available = set()
+        symlinked = set()
+        try:
+            with os.scandir(self._exams_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".pdf") and entry.is_file():
+                        available.add(entry.name[:-4])
+                        if entry.is_symlink():
+                            symlinked.add(entry.name[:-4])
+        except OSError:
+            pass
+
+        # Exam files that are symlinks to a shared template PDF are read from
+        # disk once and then opened from memory for every student using it.
+        # Only a target seen a second time is cached, and only the most recent
+        # one is kept, so per-student symlinked scans never pile up in memory.
+        seen_targets: set = set()
+        template_src: Optional[str] = None
+        template_bytes: Optional[bytes] = None
+
+        # Finished PDFs are written to disk on a background thread, so the
+        # write of one student overlaps with baking the next one.
+        write_pool = ThreadPoolExecutor(max_workers=1)
+        pending_writes: deque = deque()   # (student_number, Future)
+
+        def _finish_write(student_number, future):
+            nonlocal exported
             try:
-                student_grades = self._grades.get(student.student_number, {})
-                pdf_exporter.bake_annotations(src, anns, dst, log_path=log_path,
-                                              debug=debug,
-                                              student=student,
-                                              grades=student_grades,
-                                              scheme=self._grading_scheme,
-                                              settings=self._grading_settings)
-                if debug and log_path and os.path.isfile(log_path):
-                    print(f"[Export]   log written OK ({os.path.getsize(log_path)} bytes)")
-                elif debug and log_path:
-                    print(f"[Export]   WARNING: log file was NOT created at {log_path}")
-                exported += 1
+                future.result()
             except Exception as exc:
+                exported -= 1
                 if debug:
-                    print(f"[Export]   ERROR: {exc}")
+                    print(f"[Export]   ERROR writing {student_number}: {exc}")
                 QMessageBox.warning(
                     self, "Export Error",
-                    f"Failed to export {student.student_number}:\n{exc}"
+                    f"Failed to export {student_number}:\n{exc}"
                 )
 
+        def _queue_write(student_number, path, data):
+            pending_writes.append(
+                (student_number,
+                 write_pool.submit(pdf_exporter.write_pdf_bytes, path, data))
+            )
+
+        exported = skipped = 0
+        # Drain queued writes even if the loop raises, so nothing is dropped
+        # unreported and the writer thread is always shut down.
+        try:
+            for i, student in enumerate(self._students):
+                if cancelled:
+                    if debug:
+                        print("[Export] Cancelled by user.")
+                    break
+                progress_bar.setValue(i)
+                status_label.setText(
+                    f"Exporting annotated PDFs… ({i + 1}/{len(self._students)})"
+                )
+                QApplication.processEvents()
+                src = os.path.join(self._exams_dir, f"{student.student_number}.pdf")
+                # Fall back to a real stat() only on a snapshot miss, e.g. for
+                # "12345.PDF" on a case-insensitive file system.
+                if student.student_number not in available and not os.path.isfile(src):
+                    if debug:
+                        print(f"[Export] SKIP {student.student_number}: PDF not found at {src}")
+                    skipped += 1
+                    continue
+                anns = data_store.load_annotations(student.student_number)
+
+                try:
+                    if render_stem is None:
+                        raise ValueError("invalid filename template")
+                    stem = render_stem(student)
+                except ValueError:
+                    stem = f"{student.student_number}_annotated"
+                dst = os.path.join(output_dir, f"{stem}.pdf")
+                log_path = os.path.join(data_store.ANNOTATED_LOGS_DIR, f"{stem}.log") if debug else None
+
+                if debug:
+                    print(f"[Export] [{i+1}/{len(self._students)}] {student.student_number} → {dst}")
+                    print(f"[Export]   log file → {log_path}")
+
+                try:
+                    src_bytes = None
+                    if student.student_number in symlinked:
+                        real_src = os.path.realpath(src)
+                        if real_src == template_src:
+                            src_bytes = template_bytes
+                        elif real_src in seen_targets:
+                            with open(real_src, "rb") as f:
+                                src_bytes = f.read()
+                            template_src, template_bytes = real_src, src_bytes
+                        else:
+                            seen_targets.add(real_src)
+                    student_grades = self._grades.get(student.student_number, {})
+                    pdf_exporter.bake_annotations(src, anns, dst, log_path=log_path,
+                                                  debug=debug,
+                                                  student=student,
+                                                  grades=student_grades,
+                                                  scheme=self._grading_scheme,
+                                                  settings=self._grading_settings,
+                                                  src_bytes=src_bytes,
+                                                  writer=partial(_queue_write,
+                                                                 student.student_number))
+                    if debug and log_path and os.path.isfile(log_path):
+                        print(f"[Export]   log written OK ({os.path.getsize(log_path)} bytes)")
+                    elif debug and log_path:
+                        print(f"[Export]   WARNING: log file was NOT created at {log_path}")
+                    exported += 1
+                    while len(pending_writes) > _MAX_PENDING_WRITES:
+                        _finish_write(*pending_writes.popleft())
+                except Exception as exc:
+                    if debug:
+                        print(f"[Export]   ERROR: {exc}")
+                    QMessageBox.warning(
+                        self, "Export Error",
+                        f"Failed to export {student.student_number}:\n{exc}"
+                    )
+        finally:
+            while pending_writes:
+                _finish_write(*pending_writes.popleft())
+            write_pool.shutdown(wait=True)
+
         if debug:
             print(f"[Export] Done. exported={exported}, skipped={skipped}")
 
@@ -733,6 +861,7 @@ class MainWindow(QMainWindow):
         if self._grading_window is not None:
             self._grading_window.close()
             self._grading_window = None
+        self._pdf_viewer.shutdown()
         super().closeEvent(event)
 
 
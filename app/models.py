@@ -65,6 +65,7 @@ class GradingSettings:
     debug_mode: bool = False        # print debug messages and write .log files
     cover_page_detail: bool = False # cover page: True = show subquestion detail, False = per-exercise only
     hi_dpr: bool = False            # use high DPI rendering (Retina); disable for speed
+    page_cache_mb: int = 256        # memory budget for pre-rendered PDF pages
     grading_separate_window: bool = False  # show grading sheet in a separate window
     show_extra_fields: bool = False  # show extra CSV columns in the grading panel
     compact_table: bool = False      # use compact display (smaller font + reduced cell padding) in the grading table
@@ -8,12 +8,15 @@ with ``/Rotate 90`` it reports the wide (landscape) dimensions.
 However ``page.draw_*`` methods operate in the **native** (pre-rotation) PDF
 user-space, not in the visual coordinate space.  We therefore convert visual
 fractional annotation coordinates → visual pixels → native draw coordinates
-via ``to_draw()`` before calling any draw method.
+via ``to_draw()`` before calling any draw method.  The transform for each
+page rotation is a separate function (``_TO_DRAW_BY_ROT``) bound once per
+page.
 """
 import math
 import os
 from dataclasses import replace
-from typing import Callable, List, Optional, Tuple
+from functools import lru_cache, partial
+from typing import Callable, Dict, List, Optional, Tuple
 
 import fitz
 
@@ -27,6 +30,11 @@ _ORANGE = (1.0, 0.55, 0.0)    # tilde (~)
 _BLACK  = (0, 0, 0)
 _GREY   = (0.35, 0.35, 0.35)
 
+# Compress uncompressed streams (the content we add).  The image and font
+# flags are PyMuPDF's defaults, spelled out so that changing them is a
+# deliberate choice; deflate never recompresses already-compressed scans.
+_SAVE_OPTIONS = dict(deflate=True, deflate_images=False, deflate_fonts=False)
+
 
 def _fmt(x: float) -> str:
     """Format a number as a decimal string, never using scientific notation.
@@ -172,9 +180,19 @@ def bake_annotations(pdf_path: str, annotations: List[Annotation], output_path:
                      student: Optional[Student] = None,
                      grades: Optional[dict] = None,
                      scheme: Optional[GradingScheme] = None,
-                     settings: Optional[GradingSettings] = None):
+                     settings: Optional[GradingSettings] = None,
+                     src_bytes: Optional[bytes] = None,
+                     writer: Optional[Callable[[str, bytes], None]] = None):
     """Open *pdf_path*, draw *annotations* on each page, save to *output_path*.
 
+    If *src_bytes* is given, the PDF is opened from that in-memory copy
+    instead of being read from disk (*pdf_path* is then only used for
+    logging).  This lets callers read a shared template PDF once.
+
+    If *writer* is given, the finished PDF is serialised in memory and
+    ``writer(output_path, data)`` is called instead of saving directly, so the
+    caller can hand the disk write off to a background thread.
+
     If *student*, *grades*, *scheme*, and *settings* are all provided, a cover
     page with the student's name, mark, and grade breakdown is inserted before
     the scanned pages.
@@ -194,37 +212,51 @@ def bake_annotations(pdf_path: str, annotations: List[Annotation], output_path:
             print(f"[bake] WARNING: could not open log file {log_path!r}: {e}")
             _log_fh = None
 
+    # Every _log() call site below is guarded by _log_enabled so the f-string
+    # (and its float formatting) is never built when there is no log file.
+    _log_enabled = _log_fh is not None
+
     def _log(msg: str) -> None:
-        if _log_fh:
-            _log_fh.write(msg + "\n")
-            _log_fh.flush()
+        _log_fh.write(msg + "\n")
+        _log_fh.flush()
 
     try:
         if debug:
             print(f"[bake] source  : {pdf_path}")
             print(f"[bake] output  : {output_path}")
             print(f"[bake] annotations: {len(annotations)}")
-        _log(f"SOURCE : {pdf_path}")
-        _log(f"OUTPUT : {output_path}")
-        _log(f"ANNOTATIONS : {len(annotations)}")
-        _log("")
+        if _log_enabled:
+            _log(f"SOURCE : {pdf_path}")
+            _log(f"OUTPUT : {output_path}")
+            _log(f"ANNOTATIONS : {len(annotations)}")
+            _log("")
 
         try:
             if debug:
                 print("[bake] opening PDF…")
-            doc = fitz.open(pdf_path)
+            if src_bytes is not None:
+                doc = fitz.open(stream=src_bytes, filetype="pdf")
+            else:
+                doc = fitz.open(pdf_path)
             try:
                 # ── Insert cover page (before annotating) ─────────────────
                 cover_inserted = False
                 if student is not None and grades is not None and scheme is not None and settings is not None:
                     _insert_cover_page(doc, student, grades, scheme, settings)
                     cover_inserted = True
-                    _log("COVER PAGE inserted at page 0")
+                    if _log_enabled:
+                        _log("COVER PAGE inserted at page 0")
                     if debug:
                         print("[bake] cover page inserted at page 0")
                     # Shift annotation page indices since we prepended a page
                     annotations = [replace(a, page=a.page + 1) for a in annotations]
 
+                # Bucket annotations by page in a single pass instead of
+                # re-filtering the full list for every page.
+                by_page: Dict[int, List[Annotation]] = {}
+                for a in annotations:
+                    by_page.setdefault(a.page, []).append(a)
+
                 for page_idx in range(doc.page_count):
                     page = doc[page_idx]
 
@@ -234,102 +266,96 @@ def bake_annotations(pdf_path: str, annotations: List[Annotation], output_path:
                     mw = page.mediabox.width
                     mh = page.mediabox.height
 
-                    _log(f"=== PAGE {page_idx} ===")
-                    _log(f"  rotation       : {rot} deg")
-                    _log(f"  page.rect      : w={pw:.2f}  h={ph:.2f}  (visual/rotation-aware)")
-                    _log(f"  mediabox       : w={mw:.2f}  h={mh:.2f}  (native PDF units)")
-
-                    def to_draw(vx: float, vy: float):
-                        """Convert visual (page.rect) coords to PyMuPDF draw coords."""
-                        if rot == 90:
-                            return vy, mh - vx
-                        if rot == 180:
-                            return mw - vx, mh - vy
-                        if rot == 270:
-                            return mw - vy, vx
-                        return vx, vy   # rot == 0
+                    if _log_enabled:
+                        _log(f"=== PAGE {page_idx} ===")
+                        _log(f"  rotation       : {rot} deg")
+                        _log(f"  page.rect      : w={pw:.2f}  h={ph:.2f}  (visual/rotation-aware)")
+                        _log(f"  mediabox       : w={mw:.2f}  h={mh:.2f}  (native PDF units)")
+
+                    # Rotation is constant for the page: use the matching
+                    # coordinate transforms instead of branching per call.
+                    to_draw, to_rect = _page_transforms(rot, mw, mh)
 
                     # ── Annotations ─────────────────────────────────────────
-                    page_anns = [a for a in annotations if a.page == page_idx]
-                    _log(f"  annotations    : {len(page_anns)}")
+                    page_anns = by_page.get(page_idx, ())
+                    if _log_enabled:
+                        _log(f"  annotations    : {len(page_anns)}")
 
                     # Scale factor: match the UI overlay which uses
                     # s = img_height / 842.0  (842 pt = A4 long side at 72 dpi)
                     s = ph / 842.0
 
+                    # Vector annotations share one Shape per run between text
+                    # boxes, committed together instead of one per primitive.
+                    shapes = _ShapeBatch(page, s)
+
                     for ann_i, ann in enumerate(page_anns):
                         cx_v, cy_v = ann.x * pw, ann.y * ph
-                        _log(f"  -- ann[{ann_i}] type={ann.type!r}")
-                        _log(f"       frac   x={ann.x:.4f}  y={ann.y:.4f}")
-                        _log(f"       visual x={cx_v:.2f}  y={cy_v:.2f}  (pw={pw:.2f} ph={ph:.2f})")
+                        if _log_enabled:
+                            _log(f"  -- ann[{ann_i}] type={ann.type!r}")
+                            _log(f"       frac   x={ann.x:.4f}  y={ann.y:.4f}")
+                            _log(f"       visual x={cx_v:.2f}  y={cy_v:.2f}  (pw={pw:.2f} ph={ph:.2f})")
 
                         if ann.type == "checkmark":
-                            _draw_checkmark(page, cx_v, cy_v, to_draw, s)
+                            _draw_checkmark(shapes, cx_v, cy_v, to_draw, s)
                         elif ann.type == "cross":
-                            _draw_cross(page, cx_v, cy_v, to_draw, s)
+                            _draw_cross(shapes, cx_v, cy_v, to_draw, s)
                         elif ann.type == "tilde":
-                            _draw_tilde(page, cx_v, cy_v, rot, to_draw, s)
+                            _draw_tilde(shapes, cx_v, cy_v, rot, to_draw, s)
                         elif ann.type == "text" and ann.text:
-                            fontsize = _TEXT_FONTSIZE * s
-                            p = _TEXT_PAD_PT * s
-                            if ann.width is not None:
-                                box_w = max(ann.width * pw, 10.0)
-                            else:
-                                try:
-                                    font = fitz.Font("helv")
-                                    lines = ann.text.split("\n") if ann.text else [""]
-                                    box_w = max(
-                                        (font.text_length(ln, fontsize=fontsize) for ln in lines),
-                                        default=0.0,
-                                    ) + p * 2
-                                except Exception:
-                                    box_w = max(len(ann.text) * 5.5, 20.0)
-                                box_w = max(box_w, 20.0)
-                            _, measured_box_h = _measure_text_box(ann.text, box_w, p, fontsize)
-                            # Height is always computed from content; never stored.
-                            box_h = max(measured_box_h, 10.0)
-                            box_rect  = _text_rect(cx_v,     cy_v,     box_w,         box_h,         rot, mw, mh)
-                            text_rect = _text_rect(cx_v + p, cy_v + p, max(1.0, box_w - p * 2),
-                                                                        max(1.0, box_h - p * 2), rot, mw, mh)
-                            text_rotate = rot
-                            _log(f"       text   : {ann.text!r}")
-                            _log(f"       ann.width={ann.width}")
-                            _log(f"       box_w={box_w:.2f}  box_h={box_h:.2f}  (PDF pts)")
-                            _log(f"       box_rect  : {box_rect}")
-                            _log(f"       text_rect : {text_rect}")
-                            _log(f"       text_rotate (insert_textbox rotate=) : {text_rotate}")
-                            _draw_text(page, ann, cx_v, cy_v, pw, ph, rot, mw, mh, s)
+                            box_w, box_h, box_rect, text_rect = _text_layout(
+                                ann, cx_v, cy_v, pw, to_rect, s)
+                            if _log_enabled:
+                                _log(f"       text   : {ann.text!r}")
+                                _log(f"       ann.width={ann.width}")
+                                _log(f"       box_w={box_w:.2f}  box_h={box_h:.2f}  (PDF pts)")
+                                _log(f"       box_rect  : {box_rect}")
+                                _log(f"       text_rect : {text_rect}")
+                                _log(f"       text_rotate (insert_textbox rotate=) : {rot}")
+                            # Flush pending shapes first so the stacking order
+                            # of shapes and text boxes is preserved.
+                            shapes.commit()
+                            overflow = _draw_text(page, ann.text, box_rect, text_rect, rot, s)
+                            if overflow < 0 and _log_enabled:
+                                _log(f"       text overflow : {overflow:.2f}")
                         elif ann.type == "line" and ann.x2 is not None and ann.y2 is not None:
                             p1 = to_draw(cx_v, cy_v)
                             p2 = to_draw(ann.x2 * pw, ann.y2 * ph)
-                            _log(f"       draw_line : {p1} → {p2}")
-                            page.draw_line(p1, p2, color=_RED, width=2 * s, lineCap=1,
-                                           stroke_opacity=0.8)
+                            if _log_enabled:
+                                _log(f"       draw_line : {p1} → {p2}")
+                            shapes.shape().draw_line(p1, p2)
+                            shapes.finish("stroke")
                         elif ann.type == "arrow" and ann.x2 is not None and ann.y2 is not None:
                             p1 = to_draw(cx_v, cy_v)
                             p2 = to_draw(ann.x2 * pw, ann.y2 * ph)
-                            _log(f"       draw_arrow : {p1} → {p2}")
-                            _draw_arrow(page, p1[0], p1[1], p2[0], p2[1], s)
+                            if _log_enabled:
+                                _log(f"       draw_arrow : {p1} → {p2}")
+                            _draw_arrow(shapes, p1[0], p1[1], p2[0], p2[1], s)
                         elif ann.type == "ellipse" and ann.x2 is not None and ann.y2 is not None:
                             # Ellipse inscribed in the bounding rectangle
                             p1 = to_draw(cx_v, cy_v)
                             p2 = to_draw(ann.x2 * pw, ann.y2 * ph)
                             rect = fitz.Rect(min(p1[0], p2[0]), min(p1[1], p2[1]),
                                              max(p1[0], p2[0]), max(p1[1], p2[1]))
-                            _log(f"       draw_ellipse : rect={rect}")
-                            page.draw_oval(rect, color=_RED, width=2 * s, stroke_opacity=0.8)
+                            if _log_enabled:
+                                _log(f"       draw_ellipse : rect={rect}")
+                            shapes.shape().draw_oval(rect)
+                            shapes.finish("oval")
                         elif ann.type == "rectcross" and ann.x2 is not None and ann.y2 is not None:
                             p1 = to_draw(cx_v, cy_v)
                             p2 = to_draw(ann.x2 * pw, ann.y2 * ph)
                             p3 = to_draw(ann.x2 * pw, cy_v)
                             p4 = to_draw(cx_v, ann.y2 * ph)
-                            _log(f"       draw_rectcross : {p1}→{p2}, {p3}→{p4}")
-                            page.draw_line(p1, p2, color=_RED, width=2 * s, lineCap=1,
-                                           stroke_opacity=0.8)
-                            page.draw_line(p3, p4, color=_RED, width=2 * s, lineCap=1,
-                                           stroke_opacity=0.8)
+                            if _log_enabled:
+                                _log(f"       draw_rectcross : {p1}→{p2}, {p3}→{p4}")
+                            shapes.shape().draw_line(p1, p2)
+                            shapes.finish("stroke")
+                            shapes.shape().draw_line(p3, p4)
+                            shapes.finish("stroke")
 
-                    _log("")
+                    shapes.commit()
+                    if _log_enabled:
+                        _log("")
 
                 # Try garbage=0 first (plain save, no object restructuring) to
                 # avoid "MuPDF error: format error: object is not a stream" which
@@ -340,26 +366,34 @@ def bake_annotations(pdf_path: str, annotations: List[Annotation], output_path:
                     try:
                         if debug:
                             print(f"[bake] saving with garbage={garbage_level}…")
-                        doc.save(output_path, garbage=garbage_level, deflate=True)
+                        if writer is not None:
+                            writer(output_path,
+                                   doc.tobytes(garbage=garbage_level, **_SAVE_OPTIONS))
+                        else:
+                            doc.save(output_path, garbage=garbage_level, **_SAVE_OPTIONS)
                         save_ok = True
                         if debug:
                             print(f"[bake] save OK (garbage={garbage_level})")
-                        _log(f"SAVE OK (garbage={garbage_level})")
+                        if _log_enabled:
+                            _log(f"SAVE OK (garbage={garbage_level})")
                         break
                     except Exception as exc:
                         if debug:
                             print(f"[bake] save FAILED (garbage={garbage_level}): {exc}")
-                        _log(f"SAVE FAILED (garbage={garbage_level}): {exc}")
+                        if _log_enabled:
+                            _log(f"SAVE FAILED (garbage={garbage_level}): {exc}")
                 if not save_ok:
                     if debug:
                         print("[bake] ERROR: PDF could not be saved – all garbage levels failed.")
-                    _log("ERROR: PDF could not be saved – all garbage levels failed.")
+                    if _log_enabled:
+                        _log("ERROR: PDF could not be saved – all garbage levels failed.")
             finally:
                 doc.close()
         except Exception as exc:
             if debug:
                 print(f"[bake] FATAL ERROR opening PDF: {exc}")
-            _log(f"FATAL ERROR opening PDF: {exc}")
+            if _log_enabled:
+                _log(f"FATAL ERROR opening PDF: {exc}")
     finally:
         if _log_fh:
             _log_fh.close()
@@ -367,41 +401,95 @@ def bake_annotations(pdf_path: str, annotations: List[Annotation], output_path:
                 print(f"[bake] log file closed: {log_path}")
 
 
+def write_pdf_bytes(path: str, data: bytes) -> None:
+    """Write serialised PDF *data* to *path* (safe to run in a worker thread)."""
+    with open(path, "wb") as f:
+        f.write(data)
+
+
 # ── Shape helpers ─────────────────────────────────────────────────────────────
 
-def _draw_checkmark(page, cx_v: float, cy_v: float,
+# Stroke/fill style of each primitive: (width factor × s, finish() kwargs).
+# These reproduce the page.draw_line / draw_oval / Shape calls each primitive
+# used to make on its own; a width factor of None keeps PyMuPDF's default.
+_SHAPE_STYLES = {
+    "check":  (3, dict(color=_GREEN, lineCap=1, lineJoin=1, closePath=False,
+                       stroke_opacity=0.8)),
+    "mark":   (3, dict(color=_RED, lineCap=1, closePath=False, stroke_opacity=0.8)),
+    "tilde":  (3, dict(color=_ORANGE, lineCap=1, lineJoin=1, closePath=False,
+                       stroke_opacity=0.8)),
+    "stroke": (2, dict(color=_RED, lineCap=1, closePath=False, stroke_opacity=0.8)),
+    "shaft":  (2, dict(color=_RED, lineCap=0, closePath=False, stroke_opacity=0.8)),
+    "oval":   (2, dict(color=_RED, stroke_opacity=0.8)),
+    "head":   (None, dict(color=_RED, fill=_RED, closePath=True, fill_opacity=0.8,
+                          stroke_opacity=0.8)),
+}
+
+
+class _ShapeBatch:
+    """A lazily-created PyMuPDF Shape shared by consecutive vector primitives.
+
+    Each primitive is still finished as its own path with its own style, in
+    drawing order, so stacking and the darkening where translucent strokes
+    overlap are unchanged; only the commit into the content stream is shared.
+    """
+
+    def __init__(self, page, s: float = 1.0):
+        self._page = page
+        self._s = s
+        self._shape: Optional[fitz.Shape] = None
+
+    def shape(self) -> fitz.Shape:
+        """Return the Shape to draw the next primitive into."""
+        if self._shape is None:
+            self._shape = self._page.new_shape()
+        return self._shape
+
+    def finish(self, style: str) -> None:
+        """Close the primitive drawn since the last finish with *style*."""
+        width_factor, kwargs = _SHAPE_STYLES[style]
+        if width_factor is not None:
+            kwargs = dict(kwargs, width=width_factor * self._s)
+        self._shape.finish(**kwargs)
+
+    def commit(self) -> None:
+        """Write the finished primitives to the page (before any text box)."""
+        if self._shape is not None:
+            self._shape.commit()
+            self._shape = None
+
+
+def _draw_checkmark(shapes: _ShapeBatch, cx_v: float, cy_v: float,
                     to_draw: Callable[[float, float], Tuple[float, float]],
                     s: float = 1.0):
     r = 6 * s
-    thick = 3 * s
     p1 = to_draw(cx_v - r,     cy_v)
     p2 = to_draw(cx_v - r / 3, cy_v + r)
     p3 = to_draw(cx_v + r,     cy_v - r)
-    shape = page.new_shape()
-    shape.draw_polyline([p1, p2, p3])
-    shape.finish(color=_GREEN, width=thick, lineCap=1, lineJoin=1,
-                 closePath=False, stroke_opacity=0.8)
-    shape.commit()
+    shapes.shape().draw_polyline([p1, p2, p3])
+    shapes.finish("check")
 
 
-def _draw_cross(page, cx_v: float, cy_v: float,
+def _draw_cross(shapes: _ShapeBatch, cx_v: float, cy_v: float,
                 to_draw: Callable[[float, float], Tuple[float, float]],
                 s: float = 1.0):
     r = 6 * s
-    thick = 3 * s
-    page.draw_line(to_draw(cx_v - r, cy_v - r), to_draw(cx_v + r, cy_v + r),
-                   color=_RED, width=thick, lineCap=1, stroke_opacity=0.8)
-    page.draw_line(to_draw(cx_v + r, cy_v - r), to_draw(cx_v - r, cy_v + r),
-                   color=_RED, width=thick, lineCap=1, stroke_opacity=0.8)
+    shapes.shape().draw_line(to_draw(cx_v - r, cy_v - r), to_draw(cx_v + r, cy_v + r))
+    shapes.finish("mark")
+    shapes.shape().draw_line(to_draw(cx_v + r, cy_v - r), to_draw(cx_v - r, cy_v + r))
+    shapes.finish("mark")
 
 
-def _draw_tilde(page, cx_v: float, cy_v: float, rot: int,
+_TILDE_AMP = 5       # tilde wave amplitude in visual pts (at s = 1)
+_TILDE_HALF_W = 18   # tilde half-width on each side of centre (at s = 1)
+
+
+def _draw_tilde(shapes: _ShapeBatch, cx_v: float, cy_v: float, rot: int,
                 to_draw: Callable[[float, float], Tuple[float, float]],
                 s: float = 1.0):
     # Draw a smooth S-curve wave (same shape as the screen renderer).
-    amp = 5 * s    # amplitude in visual pts
-    ww  = 18 * s   # half-width on each side of centre
-    thick = 3 * s
+    amp = _TILDE_AMP * s
+    ww  = _TILDE_HALF_W * s
     p0  = to_draw(cx_v - ww,     cy_v)
     cp1 = to_draw(cx_v - ww / 2, cy_v - amp)
     cp2 = to_draw(cx_v,          cy_v - amp)
@@ -409,12 +497,10 @@ def _draw_tilde(page, cx_v: float, cy_v: float, rot: int,
     cp3 = to_draw(cx_v,          cy_v + amp)
     cp4 = to_draw(cx_v + ww / 2, cy_v + amp)
     p2  = to_draw(cx_v + ww,     cy_v)
-    shape = page.new_shape()
+    shape = shapes.shape()
     shape.draw_bezier(p0, cp1, cp2, p1)
     shape.draw_bezier(p1, cp3, cp4, p2)
-    shape.finish(color=_ORANGE, width=thick, lineCap=1, lineJoin=1,
-                 closePath=False, stroke_opacity=0.8)
-    shape.commit()
+    shapes.finish("tilde")
 
 
 _TEXT_PAD_PT = 3   # matches _TEXT_PAD in annotation_overlay.py
@@ -464,9 +550,13 @@ def _measure_text_box(text: str, box_w: float, p: float = _TEXT_PAD_PT,
     return box_w, box_h
 
 
-def _draw_text(page, ann: Annotation, cx_v: float, cy_v: float,
-               pw: float, ph: float, rot: int, mw: float, mh: float,
-               s: float = 1.0):
+def _text_layout(ann: Annotation, cx_v: float, cy_v: float, pw: float,
+                 to_rect: Callable[[float, float, float, float], fitz.Rect],
+                 s: float = 1.0) -> Tuple[float, float, fitz.Rect, fitz.Rect]:
+    """Return *(box_w, box_h, box_rect, text_rect)* for a text annotation.
+
+    The rects are in native draw space; sizes are in visual PDF points.
+    """
     text = ann.text or ""
     fontsize = _TEXT_FONTSIZE * s
     p = _TEXT_PAD_PT * s
@@ -489,10 +579,18 @@ def _draw_text(page, ann: Annotation, cx_v: float, cy_v: float,
     _, measured_box_h = _measure_text_box(text, box_w, p, fontsize)
     box_h = max(measured_box_h, 10.0)
 
-    box_rect  = _text_rect(cx_v,     cy_v,     box_w,         box_h,         rot, mw, mh)
-    text_rect = _text_rect(cx_v + p, cy_v + p, max(1.0, box_w - p * 2),
-                                                max(1.0, box_h - p * 2), rot, mw, mh)
+    box_rect  = to_rect(cx_v,     cy_v,     box_w,         box_h)
+    text_rect = to_rect(cx_v + p, cy_v + p, max(1.0, box_w - p * 2),
+                                             max(1.0, box_h - p * 2))
+    return box_w, box_h, box_rect, text_rect
+
+
+def _draw_text(page, text: str, box_rect: fitz.Rect, text_rect: fitz.Rect,
+               rot: int, s: float = 1.0) -> float:
+    """Draw a text annotation laid out by ``_text_layout``.
 
+    Returns the ``insert_textbox`` result (negative if the text overflowed).
+    """
     # Draw the yellow background in its own shape so that its fill_opacity does
     # NOT carry over into the text rendering (which caused invisible text).
     bg = page.new_shape()
@@ -506,57 +604,99 @@ def _draw_text(page, ann: Annotation, cx_v: float, cy_v: float,
     # rotate= must equal the page rotation so characters advance left-to-right
     # in the viewer.  Using (360-rot) reversed the direction and produced
     # upside-down text on landscape (rot=90/270) pages.
-    text_rotate = rot
-    overflow = page.insert_textbox(text_rect, text, fontsize=fontsize,
-                                   fontname="helv", color=(0, 0, 0),
-                                   align=0, rotate=text_rotate)
-    if overflow < 0:
-        # Text still did not fit (e.g. word-wrap produced more lines than
-        # measured_box_h estimated).  Re-measure without the stored-height
-        # constraint and retry with the freshly computed rect.
-        _, fallback_h = _measure_text_box(text, box_w, p, fontsize)
-        fallback_rect = _text_rect(cx_v + p, cy_v + p, max(1.0, box_w - p * 2),
-                                   max(1.0, fallback_h - p * 2), rot, mw, mh)
-        page.insert_textbox(fallback_rect, text, fontsize=fontsize,
-                            fontname="helv", color=(0, 0, 0),
-                            align=0, rotate=text_rotate)
-
-
-def _text_rect(cx_v: float, cy_v: float, bw: float, bh: float,
-               rot: int, mw: float, mh: float) -> fitz.Rect:
+    return page.insert_textbox(text_rect, text, fontsize=_TEXT_FONTSIZE * s,
+                               fontname="helv", color=(0, 0, 0),
+                               align=0, rotate=rot)
+
+
+# ── Rotation-specific coordinate transforms ───────────────────────────────────
+# Each takes the native mediabox size first so a page can bind it once with
+# functools.partial; the remaining arguments are in visual page coordinates.
+
+def _to_draw_0(mw: float, mh: float, vx: float, vy: float) -> Tuple[float, float]:
+    return vx, vy
+
+
+def _to_draw_90(mw: float, mh: float, vx: float, vy: float) -> Tuple[float, float]:
+    return vy, mh - vx
+
+
+def _to_draw_180(mw: float, mh: float, vx: float, vy: float) -> Tuple[float, float]:
+    return mw - vx, mh - vy
+
+
+def _to_draw_270(mw: float, mh: float, vx: float, vy: float) -> Tuple[float, float]:
+    return mw - vy, vx
+
+
+_TO_DRAW_BY_ROT = {0: _to_draw_0, 90: _to_draw_90, 180: _to_draw_180, 270: _to_draw_270}
+
+
+def _text_rect_0(mw: float, mh: float, cx_v: float, cy_v: float,
+                 bw: float, bh: float) -> fitz.Rect:
     """Map a visual text box top-left + size to a native draw-space Rect."""
-    if rot == 0:
-        return fitz.Rect(cx_v, cy_v, cx_v + bw, cy_v + bh)
-    if rot == 90:
-        return fitz.Rect(cy_v, mh - cx_v - bw, cy_v + bh, mh - cx_v)
-    if rot == 180:
-        return fitz.Rect(mw - cx_v - bw, mh - cy_v - bh, mw - cx_v, mh - cy_v)
-    # rot == 270
+    return fitz.Rect(cx_v, cy_v, cx_v + bw, cy_v + bh)
+
+
+def _text_rect_90(mw: float, mh: float, cx_v: float, cy_v: float,
+                  bw: float, bh: float) -> fitz.Rect:
+    return fitz.Rect(cy_v, mh - cx_v - bw, cy_v + bh, mh - cx_v)
+
+
+def _text_rect_180(mw: float, mh: float, cx_v: float, cy_v: float,
+                   bw: float, bh: float) -> fitz.Rect:
+    return fitz.Rect(mw - cx_v - bw, mh - cy_v - bh, mw - cx_v, mh - cy_v)
+
+
+def _text_rect_270(mw: float, mh: float, cx_v: float, cy_v: float,
+                   bw: float, bh: float) -> fitz.Rect:
     return fitz.Rect(mw - cy_v - bh, cx_v, mw - cy_v, cx_v + bw)
 
 
-def _draw_arrow(page, x1: float, y1: float, x2: float, y2: float, s: float = 1.0):
+_TEXT_RECT_BY_ROT = {0: _text_rect_0, 90: _text_rect_90,
+                     180: _text_rect_180, 270: _text_rect_270}
+
+
+@lru_cache(maxsize=16)
+def _page_transforms(rot: int, mw: float, mh: float):
+    """Return the *(to_draw, to_rect)* transforms for a page geometry.
+
+    Cached because all pages of a scan (and usually all students' scans)
+    share the same rotation and mediabox.
+    """
+    return (partial(_TO_DRAW_BY_ROT.get(rot, _to_draw_0), mw, mh),
+            partial(_TEXT_RECT_BY_ROT.get(rot, _text_rect_0), mw, mh))
+
+
+# Arrowhead half-angle (30°) as precomputed cosine / sine.
+_ARROW_COS_H = math.cos(math.pi / 6)
+_ARROW_SIN_H = math.sin(math.pi / 6)
+
+
+def _draw_arrow(shapes: _ShapeBatch, x1: float, y1: float, x2: float, y2: float,
+                s: float = 1.0):
     """Draw a line with a filled arrowhead at (x2, y2) – coords in draw space."""
     if x1 == x2 and y1 == y2:
         return
-    angle = math.atan2(y2 - y1, x2 - x1)
+    # Unit direction of the shaft; the arrowhead edges are this vector
+    # rotated by ±30°, expanded with the precomputed cos/sin of the half-angle.
+    dx, dy = x2 - x1, y2 - y1
+    length = math.hypot(dx, dy)
+    ux, uy = dx / length, dy / length
     size = max(4, round(12 * s))
-    half = math.pi / 6
     # Stop the shaft at the base of the arrowhead triangle so the line does
     # not show through the semi-transparent arrowhead fill.  Use a butt
     # (lineCap=0) so the line end is flat with no rounded protrusion.
-    x_stop = x2 - size * math.cos(angle) * math.cos(half)
-    y_stop = y2 - size * math.sin(angle) * math.cos(half)
-    page.draw_line((x1, y1), (x_stop, y_stop), color=_RED, width=2 * s, lineCap=0,
-                   stroke_opacity=0.8)
+    x_stop = x2 - size * ux * _ARROW_COS_H
+    y_stop = y2 - size * uy * _ARROW_COS_H
+    shapes.shape().draw_line((x1, y1), (x_stop, y_stop))
+    shapes.finish("shaft")
     pts = [
         fitz.Point(x2, y2),
-        fitz.Point(x2 - size * math.cos(angle - half),
-                   y2 - size * math.sin(angle - half)),
-        fitz.Point(x2 - size * math.cos(angle + half),
-                   y2 - size * math.sin(angle + half)),
+        fitz.Point(x2 - size * (ux * _ARROW_COS_H + uy * _ARROW_SIN_H),
+                   y2 - size * (uy * _ARROW_COS_H - ux * _ARROW_SIN_H)),
+        fitz.Point(x2 - size * (ux * _ARROW_COS_H - uy * _ARROW_SIN_H),
+                   y2 - size * (uy * _ARROW_COS_H + ux * _ARROW_SIN_H)),
     ]
-    shape = page.new_shape()
-    shape.draw_polyline(pts + [pts[0]])
-    shape.finish(fill=_RED, color=_RED, closePath=True, fill_opacity=0.8, stroke_opacity=0.8)
-    shape.commit()
+    shapes.shape().draw_polyline(pts + [pts[0]])
+    shapes.finish("head")
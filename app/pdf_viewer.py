@@ -13,26 +13,42 @@ Potential faster alternatives (for future evaluation):
    Evince/Okular.  Comparable quality to MuPDF; may be faster for certain
    page layouts.
  * **pdfium (pypdfium2)** — wraps Google's PDFium (used in Chrome).  Very
-   fast rasterisation, especially on large or complex pages.
+   fast rasterisation, especially on large or complex pages.  Available as
+   an optional raster backend: install ``pypdfium2`` and set the environment
+   variable ``EXAM_GRADER_RENDERER=pdfium``.  MuPDF is still used for page
+   geometry, and for tiled rendering of very large pages.
 """
 import math
 import os
 import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
 
 import fitz  # pymupdf
-from PySide6.QtCore import QObject, QEvent, QPoint, QRect, QSize, Qt, QTimer, Signal
-from PySide6.QtGui import QColor, QCursor, QFont, QImage, QPainter, QPen, QPixmap
+from PySide6.QtCore import (
+    QEvent, QModelIndex, QObject, QPoint, QRect, QSize, QSortFilterProxyModel,
+    QStringListModel, Qt, QTimer, Signal,
+)
+from PySide6.QtGui import QColor, QCursor, QImage, QPainter, QPen, QPixmap
 from PySide6.QtWidgets import (
-    QApplication, QHBoxLayout, QLabel, QLayout, QLineEdit, QListWidget,
-    QListWidgetItem, QPlainTextEdit, QPushButton, QScrollArea,
+    QAbstractItemView, QApplication, QHBoxLayout, QLabel, QLayout, QLineEdit,
+    QListView, QPlainTextEdit, QPushButton, QScrollArea,
     QSizePolicy, QVBoxLayout, QWidget, QWidgetItem,
 )
 
 import annotation_overlay
 import data_store
-from models import Annotation
+from models import Annotation, GradingSettings
+
+try:
+    import pypdfium2 as pdfium  # optional raster backend, see module docstring
+except ImportError:
+    pdfium = None
+
+_USE_PDFIUM = os.environ.get("EXAM_GRADER_RENDERER", "").lower() == "pdfium"
 
 TOOL_NONE      = None
 TOOL_CHECKMARK = "checkmark"
@@ -60,27 +76,48 @@ _KEY_TOOL_MAP = {
 }
 
 _DRAG_TOL = 14          # pixel hit-tolerance for drag handles
+_INDEX_PAD = 20         # hit-index box padding (≥ every hit-test tolerance)
 _WHEEL_ZOOM_DIVISOR = 800.0  # wheel-delta units that equal a 1× zoom step
+_ZOOM_SETTLE_MS = 120        # re-rasterise once wheel / pinch zoom pauses this long
+_MOVE_THROTTLE_MS = 16       # at most one `moved` signal per frame (~60 Hz)
 # Pan modifier: Cmd on macOS (MetaModifier maps to Cmd), Ctrl on Win/Linux
 _PAN_MOD = Qt.KeyboardModifier.MetaModifier | Qt.KeyboardModifier.ControlModifier
+# Modifiers that shortcuts compare against; non-standard ones (KeypadModifier,
+# GroupSwitchModifier) are masked out so comparisons are robust across platforms.
+_SHORTCUT_MODS = (Qt.KeyboardModifier.ShiftModifier
+                  | Qt.KeyboardModifier.ControlModifier
+                  | Qt.KeyboardModifier.AltModifier
+                  | Qt.KeyboardModifier.MetaModifier)
+_KEY_EVENTS = (QEvent.Type.KeyPress, QEvent.Type.KeyRelease)
 
 _INLINE_EDITOR_MIN_W  = 120
 _INLINE_EDITOR_WIDTH  = 200
 
+# Pages whose raster would exceed this many device pixels are rendered in
+# _RENDER_TILE_PX square tiles, so MuPDF never allocates a full-page buffer
+# on top of the destination pixmap.
+_TILE_THRESHOLD_PX = 8_000_000
+_RENDER_TILE_PX = 512
+
+# Trim the on-disk page cache back to data_store.PAGE_CACHE_MAX_BYTES after
+# this many cached pages have been written.
+_DISK_TRIM_EVERY = 32
+
 # Point-placement tools that show a ghost preview before clicking
 _POINT_TOOLS = {TOOL_CHECKMARK, TOOL_CROSS, TOOL_TILDE}
 
 
-_ERASER_CURSOR: Optional[QCursor] = None
+_ERASER = "eraser"  # _set_page_cursor key for the custom eraser cursor
 
 
-def _make_eraser_cursor() -> QCursor:
-    """Create (or return cached) custom eraser cursor (small ring with an 'x')."""
-    global _ERASER_CURSOR
-    if _ERASER_CURSOR is not None:
-        return _ERASER_CURSOR
-    size = 24
-    pm = QPixmap(size, size)
+@lru_cache(maxsize=8)
+def _make_eraser_cursor(dpr: float = 1.0, size: int = 24) -> QCursor:
+    """Create (or return cached) custom eraser cursor (small ring with an 'x').
+
+    The pixmap is drawn at *dpr* so the cursor stays crisp on HiDPI screens.
+    """
+    pm = QPixmap(round(size * dpr), round(size * dpr))
+    pm.setDevicePixelRatio(dpr)
     pm.fill(QColor(0, 0, 0, 0))
     p = QPainter(pm)
     p.setRenderHint(QPainter.RenderHint.Antialiasing)
@@ -93,8 +130,12 @@ def _make_eraser_cursor() -> QCursor:
     p.drawLine(m, m, size - m, size - m)
     p.drawLine(size - m, m, m, size - m)
     p.end()
-    _ERASER_CURSOR = QCursor(pm, size // 2, size // 2)
-    return _ERASER_CURSOR
+    return QCursor(pm, size // 2, size // 2)
+
+
+def _pm_bytes(pm: QPixmap) -> int:
+    """Approximate memory held by *pm* (32-bit pixels)."""
+    return pm.width() * pm.height() * 4
 
 
 def _pm_logical_size(pm: Optional[QPixmap]) -> Tuple[int, int]:
@@ -105,6 +146,67 @@ def _pm_logical_size(pm: Optional[QPixmap]) -> Tuple[int, int]:
     return 1, 1
 
 
+class _PdfiumRaster:
+    """Page rasteriser backed by PDFium (pypdfium2)."""
+
+    def __init__(self, path: str):
+        self._pdf = pdfium.PdfDocument(path)
+
+    def render(self, page_idx: int, scale: float) -> Tuple[QImage, object]:
+        """Return an RGB888 image of the page and the bitmap owning its pixels.
+
+        The image wraps the bitmap's buffer, so the bitmap must be kept
+        referenced for as long as the image is used.
+        """
+        bitmap = self._pdf[page_idx].render(scale=scale, rev_byteorder=True)
+        img = QImage(bitmap.buffer, bitmap.width, bitmap.height,
+                     bitmap.stride, QImage.Format.Format_RGB888)
+        return img, bitmap
+
+    def close(self):
+        self._pdf.close()
+
+
+def _write_cached_page(img: QImage, path: str) -> None:
+    """Save *img* to *path* atomically (runs on the disk-cache writer thread)."""
+    tmp = path + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if img.save(tmp, "PNG"):
+            os.replace(tmp, path)
+            return
+    except OSError as exc:
+        data_store.dbg(f"Could not write page cache {path}: {exc}")
+    try:
+        os.unlink(tmp)
+    except OSError:
+        pass
+
+
+def _render_tiled(page: "fitz.Page", mat: "fitz.Matrix", full: "fitz.IRect") -> QPixmap:
+    """Rasterise *page* tile by tile into one pixmap covering *full*.
+
+    The page content is interpreted once into a display list, which is then
+    replayed per tile; only one tile's samples are alive at a time.
+    """
+    dl = page.get_displaylist()
+    inv = ~mat
+    out = QPixmap(full.width, full.height)
+    out.fill(QColor(255, 255, 255))
+    painter = QPainter(out)
+    try:
+        for ty in range(full.y0, full.y1, _RENDER_TILE_PX):
+            for tx in range(full.x0, full.x1, _RENDER_TILE_PX):
+                clip = fitz.Rect(tx, ty, tx + _RENDER_TILE_PX, ty + _RENDER_TILE_PX) * inv
+                pix = dl.get_pixmap(matrix=mat, alpha=False, clip=clip)
+                img = QImage(pix.samples_mv, pix.width, pix.height,
+                             pix.stride, QImage.Format.Format_RGB888)
+                painter.drawImage(QPoint(pix.x - full.x0, pix.y - full.y0), img)
+    finally:
+        painter.end()
+    return out
+
+
 @dataclass
 class _DragState:
     kind: str        # 'point'|'line-start'|'line-end'|'line-move'|
@@ -140,23 +242,34 @@ class InlineTextEdit(QPlainTextEdit):
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         # Set font explicitly so document layout and fontMetrics() use the
         # correct size (stylesheet alone does not update the document font).
-        _font = QFont()
-        _font.setPointSize(font_pt)
-        _font.setBold(True)
+        _font = annotation_overlay._text_font(font_pt)
         self.setFont(_font)
         self.document().setDefaultFont(_font)
         self.setStyleSheet(
             "QPlainTextEdit { background-color: #ffff99; border: 1px solid #888;"
             " padding: 1px; }"
         )
-        self.document().contentsChanged.connect(self._adjust_height)
+        self._last_adj_key: Optional[Tuple[str, int, int]] = None
+        self._adj_scheduled = False
+        self.document().contentsChanged.connect(self._schedule_adjust_height)
+
+    def _schedule_adjust_height(self):
+        """Coalesce bursts of edits into one ``_adjust_height`` per event-loop turn."""
+        if not self._adj_scheduled:
+            self._adj_scheduled = True
+            QTimer.singleShot(0, self._run_scheduled_adjust)
+
+    def _run_scheduled_adjust(self):
+        self._adj_scheduled = False
+        self._adjust_height()
 
     def _adjust_height(self):
         """Resize widget height to match document content (no scrollbars).
 
         Uses QFontMetrics.boundingRect with word-wrap to compute the exact
         height needed, accounting for document margins so that wrapping aligns
-        with the actual QPlainTextEdit layout.
+        with the actual QPlainTextEdit layout.  Skipped when neither the text
+        nor the available width changed since the last call.
         """
         text = self.toPlainText() or ""
         margins = self.contentsMargins()
@@ -165,6 +278,10 @@ class InlineTextEdit(QPlainTextEdit):
         extra_h = frame + margins.top() + margins.bottom() + 2 * doc_margin
         inner_w = max(1, self.width() - frame - margins.left() - margins.right()
                        - 2 * doc_margin)
+        key = (text, inner_w, extra_h)
+        if key == self._last_adj_key:
+            return
+        self._last_adj_key = key
 
         fm = self.fontMetrics()
         if text:
@@ -230,26 +347,25 @@ class _ToolShortcutFilter(QObject):
         return global_rect.contains(QCursor.pos())
 
     def eventFilter(self, obj, event):
+        # Every event of every object passes through here; bail out on
+        # anything that isn't a key event before doing any other work.
+        etype = event.type()
+        if etype not in _KEY_EVENTS:
+            return False
+
+        key = event.key()
         # Immediately refresh the pan cursor whenever the pan modifier is
         # pressed or released so that the hand cursor appears / disappears
         # without the user having to move the mouse first.
-        if event.type() in (QEvent.Type.KeyPress, QEvent.Type.KeyRelease):
-            if event.key() in (Qt.Key.Key_Meta, Qt.Key.Key_Control):
-                if self._mouse_over_pdf():
-                    self._viewer._refresh_cursor_at_mouse()
-                return False
+        if key in (Qt.Key.Key_Meta, Qt.Key.Key_Control):
+            if self._mouse_over_pdf():
+                self._viewer._refresh_cursor_at_mouse()
+            return False
 
-        if event.type() != QEvent.Type.KeyPress:
+        if etype != QEvent.Type.KeyPress:
             return False
 
-        key  = event.key()
-        # Mask out non-standard modifiers (e.g. KeypadModifier,
-        # GroupSwitchModifier) so comparisons are robust across platforms.
-        _RELEVANT = (Qt.KeyboardModifier.ShiftModifier
-                     | Qt.KeyboardModifier.ControlModifier
-                     | Qt.KeyboardModifier.AltModifier
-                     | Qt.KeyboardModifier.MetaModifier)
-        mods  = event.modifiers() & _RELEVANT
+        mods  = event.modifiers() & _SHORTCUT_MODS
         alt   = Qt.KeyboardModifier.AltModifier
         shift = Qt.KeyboardModifier.ShiftModifier
 
@@ -314,6 +430,48 @@ class _ToolShortcutFilter(QObject):
         return False
 
 
+class _StampPopupKeys(QObject):
+    """Keyboard navigation between the stamp popup's filter field and list.
+
+    Enter picks the current (or first) preset, Down moves from the filter
+    into the list, Up on the list's first row moves back, Escape closes.
+    """
+
+    def __init__(self, filter_edit: QLineEdit, preset_list: QListView,
+                 pick: Callable[[QModelIndex], None], close: Callable[[], None],
+                 parent=None):
+        super().__init__(parent)
+        self._edit = filter_edit
+        self._list = preset_list
+        self._pick = pick
+        self._close = close
+
+    def eventFilter(self, obj, event):
+        if event.type() != QEvent.Type.KeyPress:
+            return False
+        key = event.key()
+        if key in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
+            index = self._list.currentIndex()
+            if obj is self._edit and not index.isValid():
+                index = self._list.model().index(0, 0)
+            self._pick(index)
+            return True
+        if key == Qt.Key.Key_Escape:
+            self._close()
+            return True
+        if obj is self._edit and key == Qt.Key.Key_Down:
+            first = self._list.model().index(0, 0)
+            if first.isValid():
+                self._list.setCurrentIndex(first)
+                self._list.setFocus()
+            return True
+        if (obj is self._list and key == Qt.Key.Key_Up
+                and self._list.currentIndex().row() <= 0):
+            self._edit.setFocus()
+            return True
+        return False
+
+
 class _FlowLayout(QLayout):
     """Simple flow layout: items wrap to the next row when they don't fit."""
 
@@ -322,9 +480,11 @@ class _FlowLayout(QLayout):
         self._h_spacing = h_spacing
         self._v_spacing = v_spacing
         self._items: list = []
+        self._hint_cache: List[QSize] = []  # item size hints, reset on invalidate()
 
     def addItem(self, item):
         self._items.append(item)
+        self._hint_cache.clear()
 
     def count(self):
         return len(self._items)
@@ -336,9 +496,14 @@ class _FlowLayout(QLayout):
 
     def takeAt(self, index):
         if 0 <= index < len(self._items):
+            self._hint_cache.clear()
             return self._items.pop(index)
         return None
 
+    def invalidate(self):
+        self._hint_cache.clear()
+        super().invalidate()
+
     def expandingDirections(self):
         return Qt.Orientation(0)
 
@@ -358,42 +523,99 @@ class _FlowLayout(QLayout):
     def minimumSize(self):
         w = h = 0
         for item in self._items:
-            w = max(w, item.minimumSize().width())
-            h = max(h, item.minimumSize().height())
+            ms = item.minimumSize()
+            w = max(w, ms.width())
+            h = max(h, ms.height())
         m = self.contentsMargins()
         return QSize(w + m.left() + m.right(), h + m.top() + m.bottom())
 
     def _do_layout(self, rect, test_only):
         m = self.contentsMargins()
         effective = rect.adjusted(m.left(), m.top(), -m.right(), -m.bottom())
-        x = effective.x()
+        left = effective.x()
+        right = effective.right()
+        x = left
         y = effective.y()
         row_h = 0
-        for item in self._items:
-            w = item.sizeHint().width()
-            h = item.sizeHint().height()
-            if x + w > effective.right() + 1 and x > effective.x():
-                x = effective.x()
+        if len(self._hint_cache) != len(self._items):
+            self._hint_cache = [item.sizeHint() for item in self._items]
+        for item, hint in zip(self._items, self._hint_cache):
+            w = hint.width()
+            h = hint.height()
+            if x + w > right + 1 and x > left:
+                x = left
                 y += row_h + self._v_spacing
                 row_h = 0
             if not test_only:
-                item.setGeometry(QRect(QPoint(x, y), item.sizeHint()))
+                item.setGeometry(QRect(QPoint(x, y), hint))
             x += w + self._h_spacing
             row_h = max(row_h, h)
         return y + row_h - rect.y() + m.bottom()
 
 
 class ClickableLabel(QLabel):
-    """QLabel that emits fractional-coordinate mouse signals."""
+    """QLabel that emits fractional-coordinate mouse signals.
+
+    The pixmap is kept by reference and painted here rather than handed to
+    QLabel, which would hold a second, shared copy: painting into the shown
+    pixmap then stays in place instead of detaching a full copy.
+    """
 
     pressed       = Signal(float, float)
     moved         = Signal(float, float)
     released      = Signal(float, float)
     double_clicked = Signal(float, float)
+    left          = Signal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMouseTracking(True)
+        # Optional callback painting transient content over the pixmap
+        self.overlay_painter: Optional[Callable[[QPainter], None]] = None
+        # Mouse moves are throttled: the first move is emitted at once, later
+        # ones within _MOVE_THROTTLE_MS are coalesced into the latest position.
+        self._pending_move: Optional[Tuple[float, float]] = None
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(_MOVE_THROTTLE_MS)
+        self._move_timer.timeout.connect(self._on_move_timer)
+        # Global position of the mouse event behind the latest signal, so
+        # handlers needn't query the window system with QCursor.pos().
+        self.last_global_pos = QPoint()
+        self._pixmap = QPixmap()
+
+    def setPixmap(self, pixmap: QPixmap):
+        self._pixmap = pixmap
+        self.update()
+
+    def pixmap(self) -> QPixmap:
+        return self._pixmap
+
+    def _on_move_timer(self):
+        if self._pending_move is not None:
+            fx, fy = self._pending_move
+            self._pending_move = None
+            self._move_timer.start()
+            self.moved.emit(fx, fy)
+
+    def _flush_move(self):
+        """Emit a pending move now (before press/release, to keep ordering)."""
+        self._move_timer.stop()
+        if self._pending_move is not None:
+            fx, fy = self._pending_move
+            self._pending_move = None
+            self.moved.emit(fx, fy)
+
+    def paintEvent(self, event):
+        if self._pixmap.isNull():
+            super().paintEvent(event)  # placeholder text
+            return
+        painter = QPainter(self)
+        painter.setClipRect(event.rect())
+        painter.drawPixmap(0, 0, self._pixmap)
+        if self.overlay_painter is not None:
+            self.overlay_painter(painter)
+        painter.end()
 
     def _frac(self, event) -> Tuple[float, float]:
         w, h = self.width(), self.height()
@@ -405,22 +627,37 @@ class ClickableLabel(QLabel):
         return 0.0, 0.0
 
     def mousePressEvent(self, event):
+        self._flush_move()
+        self.last_global_pos = event.globalPosition().toPoint()
         if event.button() == Qt.MouseButton.LeftButton:
             fx, fy = self._frac(event)
             self.pressed.emit(fx, fy)
         super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event):
-        fx, fy = self._frac(event)
-        self.moved.emit(fx, fy)
+        self.last_global_pos = event.globalPosition().toPoint()
+        if self._move_timer.isActive():
+            self._pending_move = self._frac(event)
+        else:
+            self._move_timer.start()
+            fx, fy = self._frac(event)
+            self.moved.emit(fx, fy)
         event.accept()
 
     def mouseReleaseEvent(self, event):
+        self._flush_move()
+        self.last_global_pos = event.globalPosition().toPoint()
         if event.button() == Qt.MouseButton.LeftButton:
             fx, fy = self._frac(event)
             self.released.emit(fx, fy)
         super().mouseReleaseEvent(event)
 
+    def leaveEvent(self, event):
+        self._move_timer.stop()
+        self._pending_move = None
+        self.left.emit()
+        super().leaveEvent(event)
+
     def mouseDoubleClickEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
             fx, fy = self._frac(event)
@@ -449,6 +686,7 @@ class PDFViewerPanel(QWidget):
         self._editing_ann_idx: int = -1   # annotation index hidden during edit
         self._raw_pixmap: Optional[QPixmap] = None   # PDF page, no annotations
         self._base_pixmap: Optional[QPixmap] = None  # PDF page + baked annotations
+        self._preview_bbox: QRect = QRect()  # label area covered by the shape preview
         self._drag: Optional[_DragState] = None
         self._drag_moved: bool = False
         # Pan-by-drag state (Cmd/Ctrl + left-drag)
@@ -460,10 +698,45 @@ class PDFViewerPanel(QWidget):
         self._hi_dpr: bool = False
         self._hover_pos: Optional[Tuple[float, float]] = None  # mouse pos for point-tool preview
         self._eraser_hover_idx: int = -1  # annotation index under eraser cursor
-        # Pre-render cache: { page_index: QPixmap }
-        self._page_cache: Dict[int, QPixmap] = {}
+        self._cursor_shape = None  # last cursor key set by _set_page_cursor
+        # Hit-test index of the current page (see _hit_candidates); rebuilt
+        # lazily whenever _ann_version, the page or the page size changes.
+        # _ann_version is bumped wherever self._annotations is mutated.
+        self._ann_version: int = 0
+        self._hit_index: List[Tuple[float, float, float, float, int]] = []
+        self._hit_index_key: Optional[Tuple[int, int, int, int]] = None
+        # Pre-render cache: { page_index: QPixmap }, least recently used first
+        self._page_cache: "OrderedDict[int, QPixmap]" = OrderedDict()
+        self._cache_bytes: int = 0
+        self._cache_budget: int = GradingSettings.page_cache_mb * 1024 * 1024
+        # Pages from before the last zoom / DPR change: { page: (pixmap, zoom, dpr) },
+        # shown scaled while the current page is re-rasterised
+        self._stale_cache: Dict[int, Tuple[QPixmap, float, float]] = {}
+        self._rebuild_pending: bool = False  # full bake requested by set_annotations
         self._cache_zoom: float = 0.0  # zoom level the cache was built at
         self._cache_dpr: float = 0.0   # dpr the cache was built at
+        # Deferred rendering (see _render_page)
+        self._render_gen: int = 0          # bumped on every render request
+        self._render_pending: bool = False  # current page not rasterised yet
+        self._render_t0: float = 0.0
+        self._prerender_queue: List[int] = []  # adjacent pages still to render
+        self._raw_zoom: float = 0.0  # zoom level _raw_pixmap was rasterised at
+        # On-disk raster cache (see data_store.page_cache_key); PNG encoding
+        # happens on a single background thread.
+        self._disk_key: Optional[str] = None
+        self._pdfium: Optional[_PdfiumRaster] = None
+        self._disk_writer = ThreadPoolExecutor(max_workers=1)
+        # Queued writes and the object owning each image's pixels (MuPDF or
+        # PDFium buffer).  Owners are released here on the GUI thread once
+        # their write is done, never on the writer thread.
+        self._disk_jobs: List[Tuple[Future, object]] = []
+        self._disk_writes: int = 0
+        # Wheel / pinch zoom shows a scaled pixmap until input settles
+        self._zoom_settle_timer = QTimer(self)
+        self._zoom_settle_timer.setSingleShot(True)
+        self._zoom_settle_timer.setInterval(_ZOOM_SETTLE_MS)
+        self._zoom_settle_timer.timeout.connect(self._settle_zoom)
+        self._zoom_preview_pending: bool = False
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -561,6 +834,13 @@ class PDFViewerPanel(QWidget):
         self._page_label.moved.connect(self._on_page_moved)
         self._page_label.released.connect(self._on_page_released)
         self._page_label.double_clicked.connect(self._on_page_double_clicked)
+        self._page_label.left.connect(self._on_page_left)
+        self._page_label.overlay_painter = self._paint_shape_preview
+        # Point-tool ghost: a small child label moved with the cursor, so the
+        # page pixmap itself is never touched while hovering.
+        self._ghost_marker = QLabel(self._page_label)
+        self._ghost_marker.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self._ghost_marker.hide()
         self._scroll.setWidget(self._page_label)
         layout.addWidget(self._scroll, stretch=1)
 
@@ -579,7 +859,13 @@ class PDFViewerPanel(QWidget):
         if self._doc:
             self._doc.close()
             self._doc = None
+        if self._pdfium:
+            self._drain_disk_jobs()  # queued writes may still read its bitmaps
+            self._pdfium.close()
+            self._pdfium = None
+        self._disk_key = None
         self._annotations = annotations
+        self._ann_version += 1
         self._current_page = 0
         self._line_start = None
         self._preview_pos = None
@@ -589,12 +875,20 @@ class PDFViewerPanel(QWidget):
         self._cancel_inline_editor()
         self._close_stamp_popup()
         self._invalidate_cache()
+        self._stale_cache.clear()
+        self._cache_bytes = 0
         if pdf_path and os.path.isfile(pdf_path):
             self._pdf_path = pdf_path
             try:
                 self._doc = fitz.open(pdf_path)
+                self._disk_key = data_store.page_cache_key(pdf_path)
                 if self._doc.page_count == 0:
                     raise ValueError("PDF has no pages")
+                if _USE_PDFIUM and pdfium is not None:
+                    try:
+                        self._pdfium = _PdfiumRaster(pdf_path)
+                    except Exception as exc:
+                        data_store.dbg(f"PDFium cannot open {pdf_path}, using MuPDF: {exc}")
                 data_store.dbg(f"PDF loaded: {pdf_path} ({self._doc.page_count} page(s))")
                 # Warn about annotations that reference pages beyond the PDF
                 for ann in self._annotations:
@@ -624,16 +918,28 @@ class PDFViewerPanel(QWidget):
             self._show_placeholder()
 
     def set_annotations(self, annotations: List[Annotation]):
-        """Replace annotations and re-render.  Does NOT emit annotations_changed."""
+        """Replace annotations and re-render.  Does NOT emit annotations_changed.
+
+        The re-bake is deferred to the next event-loop turn, so a burst of
+        calls (or a call followed by a page change) bakes only once.
+        """
         self._annotations = list(annotations)
-        self._rebuild_base_and_display()
+        self._ann_version += 1
+        if not self._rebuild_pending:
+            self._rebuild_pending = True
+            QTimer.singleShot(0, self._flush_rebuild)
+
+    def _flush_rebuild(self):
+        if self._rebuild_pending:
+            self._rebuild_pending = False
+            self._rebuild_base_and_display()
 
     def clear(self):
         self.load_pdf(None, [])
 
     def set_active_tool(self, tool: Optional[str]):
         had_preview = self._hover_pos is not None or self._preview_pos is not None
-        had_eraser_fade = self._eraser_hover_idx >= 0
+        faded_idx = self._eraser_hover_idx
         if tool != self._active_tool:
             self._line_start = None
             self._preview_pos = None
@@ -659,8 +965,8 @@ class PDFViewerPanel(QWidget):
                             max(0.0, min(1.0, label_pos.x() / lw)),
                             max(0.0, min(1.0, label_pos.y() / lh)),
                         )
-        if had_eraser_fade:
-            self._rebuild_base_and_display()
+        if faded_idx >= 0 and self._eraser_hover_idx < 0:
+            self._rebuild_base_and_display(self._ann_rect(faded_idx))
         elif had_preview or self._hover_pos is not None:
             self._update_display()
 
@@ -674,6 +980,11 @@ class PDFViewerPanel(QWidget):
         """Update the list of preset texts available to the Stamp tool."""
         self._preset_annotations = list(presets)
 
+    def set_cache_budget_mb(self, mb: int):
+        """Cap the memory used by pre-rendered pages at *mb* megabytes."""
+        self._cache_budget = max(1, mb) * 1024 * 1024
+        self._evict_cache()
+
     def set_hi_dpr(self, enabled: bool):
         """Enable or disable high-DPI rendering.  Re-renders the page if changed."""
         if enabled != self._hi_dpr:
@@ -708,14 +1019,35 @@ class PDFViewerPanel(QWidget):
 
     # ── Rendering ─────────────────────────────────────────────────────────────
 
+    def _hit_candidates(self, mx: float, my: float, w: int, h: int) -> List[int]:
+        """Indices of current-page annotations that may be hit at pixel *(mx, my)*.
+
+        Topmost (last-drawn) first.  Backed by a list of padded bounding
+        boxes for the current page, so the exact hit tests only run for
+        annotations near the pointer.
+        """
+        key = (self._ann_version, self._current_page, w, h)
+        if key != self._hit_index_key:
+            self._hit_index_key = key
+            index = []
+            for i in range(len(self._annotations) - 1, -1, -1):
+                ann = self._annotations[i]
+                if ann.page == self._current_page:
+                    index.append(annotation_overlay.hit_box(ann, w, h, _INDEX_PAD) + (i,))
+            self._hit_index = index
+        return [i for x0, y0, x1, y1, i in self._hit_index
+                if x0 <= mx <= x1 and y0 <= my <= y1]
+
     def _page_size(self) -> Tuple[int, int]:
         """Return *(width, height)* of the current page pixmap in logical pixels."""
         pm = self._page_label.pixmap()
         return _pm_logical_size(pm)
 
     def _show_placeholder(self, message: str = "No PDF loaded.\nSelect a student from the list."):
+        self._render_pending = False
         self._raw_pixmap = None
         self._base_pixmap = None
+        self._preview_bbox = QRect()
         self._page_label.setPixmap(QPixmap())
         self._page_label.setText(message)
         self._page_label.resize(400, 300)
@@ -724,177 +1056,431 @@ class PDFViewerPanel(QWidget):
         self._next_btn.setEnabled(False)
 
     def _render_page(self):
-        """Full re-render: rasterise via fitz (slow), then bake annotations."""
+        """Show the current page, rasterising it via fitz if it is not cached.
+
+        A cache miss does not rasterise immediately: the work is deferred to
+        the next event-loop turn and tagged with ``_render_gen``.  Input that
+        arrives meanwhile is still processed, and when several page changes
+        happen in a burst only the page that ends up current is rasterised —
+        earlier requests see a newer generation and are dropped.  (PyMuPDF
+        cannot be driven from worker threads, so this stays on the UI thread.)
+        """
+        self._zoom_settle_timer.stop()  # any pending zoom preview is superseded
         if not self._doc:
             self._show_placeholder()
             return
-        t0 = time.perf_counter()
+        self._render_t0 = time.perf_counter()
         data_store.dbg(f"Start rendering page {self._current_page + 1}")
         n = self._doc.page_count
         self._page_counter.setText(f"Page {self._current_page + 1} / {n}")
         self._prev_btn.setEnabled(self._current_page > 0)
         self._next_btn.setEnabled(self._current_page < n - 1)
+        self._zoom_label.setText(f"{int(self._zoom * 100)}%")
 
+        self._render_gen += 1
         dpr = self.devicePixelRatio() if self._hi_dpr else 1.0
 
         # Use cache if available for the current page at the right zoom/dpr
         if (self._current_page in self._page_cache
                 and self._cache_zoom == self._zoom
                 and self._cache_dpr == dpr):
-            raw = self._page_cache[self._current_page]
-        else:
-            try:
-                raw = self._render_page_pixmap(self._current_page, dpr)
-            except Exception as exc:
-                data_store.dbg(f"Failed to render page {self._current_page + 1}: {exc}")
-                self._show_placeholder(
-                    f"Cannot render page {self._current_page + 1}.\nThe PDF may be corrupted."
-                )
-                return
-            self._page_cache[self._current_page] = raw
-            self._cache_zoom = self._zoom
-            self._cache_dpr = dpr
+            self._show_raw_pixmap(self._cache_get(self._current_page))
+            return
 
+        # Keep the previous image (or a scaled stale one of this page) on
+        # screen until the new one is ready, but drop the raw page so nothing
+        # re-bakes annotations onto it.
+        self._show_stale_page(dpr)
+        self._raw_pixmap = None
+        self._render_pending = True
+        gen = self._render_gen
+        QTimer.singleShot(0, lambda: self._finish_render(gen))
+
+    def _finish_render(self, gen: int):
+        """Deferred part of ``_render_page``: rasterise if still current."""
+        if gen != self._render_gen or not self._doc:
+            return  # superseded by a later page / zoom change
+        self._render_pending = False
+        dpr = self.devicePixelRatio() if self._hi_dpr else 1.0
+        try:
+            raw = self._render_page_pixmap(self._current_page, dpr)
+        except Exception as exc:
+            data_store.dbg(f"Failed to render page {self._current_page + 1}: {exc}")
+            self._show_placeholder(
+                f"Cannot render page {self._current_page + 1}.\nThe PDF may be corrupted."
+            )
+            return
+        if self._cache_zoom != self._zoom or self._cache_dpr != dpr:
+            self._invalidate_cache()
+        self._cache_put(self._current_page, raw)
+        self._cache_zoom = self._zoom
+        self._cache_dpr = dpr
+        self._show_raw_pixmap(raw)
+
+    def _show_raw_pixmap(self, raw: QPixmap):
+        """Display *raw* as the current page and bake annotations onto it."""
+        self._render_pending = False
         self._raw_pixmap = raw
-        self._zoom_label.setText(f"{int(self._zoom * 100)}%")
+        self._raw_zoom = self._zoom
         self._rebuild_base_and_display()
-        elapsed = time.perf_counter() - t0
+        elapsed = time.perf_counter() - self._render_t0
         data_store.dbg(f"Page {self._current_page + 1} rendered in {elapsed:.3f}s")
 
         # Kick off pre-rendering of adjacent pages after the current one is shown
-        QTimer.singleShot(0, self._prerender_adjacent)
+        self._prerender_adjacent()
 
     def _render_page_pixmap(self, page_idx: int, dpr: float) -> QPixmap:
-        """Rasterise a single page and return a QPixmap with the given DPR."""
+        """Rasterise a single page and return a QPixmap with the given DPR.
+
+        A raster previously written to the on-disk cache for the same file,
+        page, zoom and DPR is loaded instead of running MuPDF.
+        """
         page = self._doc[page_idx]
+        mat = fitz.Matrix(self._zoom * dpr, self._zoom * dpr)
+        full = (page.rect * mat).irect
+        cache_file = None
+        if self._disk_key:
+            cache_file = data_store.page_cache_file(self._disk_key, page_idx, self._zoom, dpr)
+            if os.path.isfile(cache_file):
+                raw = QPixmap(cache_file)
+                # PDFium may round the page size one pixel differently
+                if (abs(raw.width() - full.width) <= 1
+                        and abs(raw.height() - full.height) <= 1):
+                    data_store.dbg(f"Loaded page {page_idx + 1} from disk cache")
+                    raw.setDevicePixelRatio(dpr)
+                    return raw
         data_store.dbg(f"Rendering page {page_idx + 1}/{self._doc.page_count} "
                        f"at zoom {self._zoom:.2f} dpr {dpr:.1f} "
                        f"(page size: {page.rect.width:.0f}×{page.rect.height:.0f} pt)")
-        mat = fitz.Matrix(self._zoom * dpr, self._zoom * dpr)
-        pix = page.get_pixmap(matrix=mat, alpha=False)
-        img = QImage(pix.samples, pix.width, pix.height,
-                     pix.stride, QImage.Format.Format_RGB888)
-        raw = QPixmap.fromImage(img)
+        owner = None  # keeps the snapshot's pixel buffer alive
+        if full.width * full.height > _TILE_THRESHOLD_PX:
+            raw = _render_tiled(page, mat, full)
+            # No QImage of the whole page exists here, and making one would be
+            # a full-page copy on the UI thread; tiled pages skip the disk cache.
+            snapshot = cache_file = None
+        elif self._pdfium is not None:
+            img, owner = self._pdfium.render(page_idx, self._zoom * dpr)
+            raw = QPixmap.fromImage(img)
+            snapshot = img
+        else:
+            pix = page.get_pixmap(matrix=mat, alpha=False)
+            # Wrap MuPDF's sample buffer directly (samples_mv is a memoryview, so
+            # no bytes copy is made).  QPixmap.fromImage takes its own copy, and
+            # `pix` stays alive until then because it is still referenced here.
+            img = QImage(pix.samples_mv, pix.width, pix.height,
+                         pix.stride, QImage.Format.Format_RGB888)
+            raw = QPixmap.fromImage(img)
+            snapshot, owner = img, pix
         raw.setDevicePixelRatio(dpr)
+        if cache_file:
+            self._queue_disk_write(snapshot, cache_file, owner)
         return raw
 
+    def _queue_disk_write(self, img: QImage, path: str, owner: object) -> None:
+        """Hand *img* to the writer thread, trimming the disk cache now and then."""
+        self._disk_jobs = [job for job in self._disk_jobs if not job[0].done()]
+        self._disk_jobs.append(
+            (self._disk_writer.submit(_write_cached_page, img, path), owner))
+        self._disk_writes += 1
+        if self._disk_writes % _DISK_TRIM_EVERY == 0:
+            self._disk_writer.submit(data_store.trim_page_cache)
+
+    def _drain_disk_jobs(self) -> None:
+        """Wait for queued disk-cache writes and release their pixel owners."""
+        for future, _owner in self._disk_jobs:
+            future.result()
+        self._disk_jobs.clear()
+
+    def shutdown(self) -> None:
+        """Finish queued disk-cache writes; call once before the app exits."""
+        self._disk_writer.shutdown(wait=True)
+        self._disk_jobs.clear()
+
+    def _show_stale_page(self, dpr: float):
+        """Show the current page scaled from the stale cache, if it is there."""
+        stale = self._stale_cache.get(self._current_page)
+        if stale is None:
+            return
+        pm, zoom, old_dpr = stale
+        ratio = (self._zoom * dpr) / (zoom * old_dpr)
+        scaled = pm.scaled(
+            max(1, round(pm.width() * ratio)), max(1, round(pm.height() * ratio)),
+            Qt.AspectRatioMode.IgnoreAspectRatio,
+            Qt.TransformationMode.FastTransformation,
+        )
+        scaled.setDevicePixelRatio(dpr)
+        shown = annotation_overlay.draw_annotations(
+            scaled, self._annotations, self._current_page,
+            skip_index=self._editing_ann_idx,
+        )
+        self._page_label.setPixmap(shown)
+        w, h = _pm_logical_size(shown)
+        self._page_label.resize(w, h)
+        self._ghost_marker.hide()
+
     def _invalidate_cache(self):
-        """Clear the pre-render cache (e.g. after zoom or DPR change)."""
+        """Clear the pre-render cache (e.g. after zoom or DPR change).
+
+        The current page and its neighbours are kept as the stale tier used
+        by ``_show_stale_page``; it is replaced on the next invalidation.
+        """
+        if self._page_cache:
+            keep = (self._current_page - 1, self._current_page, self._current_page + 1)
+            self._stale_cache = {
+                idx: (self._page_cache[idx], self._cache_zoom, self._cache_dpr)
+                for idx in keep if idx in self._page_cache
+            }
         self._page_cache.clear()
+        # The stale tier counts against the same budget as the live cache
+        self._cache_bytes = sum(_pm_bytes(pm) for pm, _z, _d in self._stale_cache.values())
+        self._prerender_queue.clear()
+
+    def _cache_get(self, idx: int) -> QPixmap:
+        """Return the cached pixmap for page *idx*, marking it recently used."""
+        self._page_cache.move_to_end(idx)
+        return self._page_cache[idx]
+
+    def _cache_put(self, idx: int, pm: QPixmap):
+        """Insert *pm* for page *idx* and evict old pages beyond the budget."""
+        old = self._page_cache.pop(idx, None)
+        if old is not None:
+            self._cache_bytes -= _pm_bytes(old)
+        self._page_cache[idx] = pm
+        self._cache_bytes += _pm_bytes(pm)
+        self._evict_cache()
+
+    def _evict_cache(self):
+        """Drop pages until the cache (stale tier included) fits its budget.
+
+        Stale pages go first, farthest from the current page first, then
+        live pages in least recently used order.  The most recent live entry
+        is always kept, even if it alone is too large.
+        """
+        while self._cache_bytes > self._cache_budget:
+            if self._stale_cache:
+                idx = max(self._stale_cache, key=lambda i: abs(i - self._current_page))
+                pm = self._stale_cache.pop(idx)[0]
+            elif len(self._page_cache) > 1:
+                _, pm = self._page_cache.popitem(last=False)
+            else:
+                break
+            self._cache_bytes -= _pm_bytes(pm)
 
     def _prerender_adjacent(self):
-        """Pre-render the next and previous pages into the cache."""
+        """Queue the next and previous pages for pre-rendering into the cache.
+
+        Pages are rasterised one per event-loop turn so that input arriving
+        between them is handled promptly; the queue is dropped as soon as
+        another page is requested or the cache is invalidated.
+        """
         if not self._doc:
             return
+        n = self._doc.page_count
+        # Only prefetch as many neighbours as fit beside the current page;
+        # otherwise each one would evict the page being viewed.
+        current = self._page_cache.get(self._current_page)
+        room = 2
+        if current is not None:
+            room = min(room, self._cache_budget // max(1, _pm_bytes(current)) - 1)
+        self._prerender_queue = [
+            idx for idx in (self._current_page + 1, self._current_page - 1)
+            if 0 <= idx < n and idx not in self._page_cache
+        ][:max(0, room)]
+        if self._prerender_queue:
+            gen = self._render_gen
+            QTimer.singleShot(0, lambda: self._prerender_step(gen))
+
+    def _prerender_step(self, gen: int):
+        """Render one queued adjacent page, then yield to the event loop."""
+        if gen != self._render_gen or not self._doc or not self._prerender_queue:
+            return
         dpr = self.devicePixelRatio() if self._hi_dpr else 1.0
         if self._cache_zoom != self._zoom or self._cache_dpr != dpr:
-            self._invalidate_cache()
-            self._cache_zoom = self._zoom
-            self._cache_dpr = dpr
-        for idx in (self._current_page - 1, self._current_page + 1):
-            if 0 <= idx < self._doc.page_count and idx not in self._page_cache:
-                try:
-                    self._page_cache[idx] = self._render_page_pixmap(idx, dpr)
-                except Exception:
-                    pass  # skip pre-render for corrupt pages
-
-    def _rebuild_base_and_display(self):
-        """Redraw all annotations onto the cached raw page, refresh display."""
+            return  # the cache belongs to another zoom; _render_page resets it
+        idx = self._prerender_queue.pop(0)
+        if idx not in self._page_cache:
+            try:
+                self._cache_put(idx, self._render_page_pixmap(idx, dpr))
+            except Exception:
+                pass  # skip pre-render for corrupt pages
+        if self._prerender_queue:
+            QTimer.singleShot(0, lambda: self._prerender_step(gen))
+
+    def _rebuild_base_and_display(self, dirty: Optional[QRect] = None):
+        """Redraw annotations onto the cached raw page, refresh display.
+
+        With *dirty* (logical px, e.g. from ``_ann_rect``) only that region of
+        the existing base is restored and repainted; otherwise every
+        annotation is baked onto a fresh copy of the raw page.
+        """
         if self._raw_pixmap is None:
             return
-        self._base_pixmap = annotation_overlay.draw_annotations(
-            self._raw_pixmap, self._annotations, self._current_page,
-            skip_index=self._editing_ann_idx,
-            fade_index=self._eraser_hover_idx,
-        )
+        if dirty is None or self._base_pixmap is None:
+            self._rebuild_pending = False
+            self._base_pixmap = annotation_overlay.draw_annotations(
+                self._raw_pixmap, self._annotations, self._current_page,
+                skip_index=self._editing_ann_idx,
+                fade_index=self._eraser_hover_idx,
+            )
+        elif not dirty.isEmpty():
+            annotation_overlay.redraw_region(
+                self._base_pixmap, self._raw_pixmap,
+                self._annotations, self._current_page, dirty,
+                skip_index=self._editing_ann_idx,
+                fade_index=self._eraser_hover_idx,
+            )
+            # The label paints this very pixmap, so only *dirty* needs a repaint
+            self._page_label.update(dirty)
         self._update_display()
 
+    def _ann_rect(self, idx: int) -> QRect:
+        """Logical-pixel bounds of annotation *idx* on the current page."""
+        if (self._base_pixmap is None or not 0 <= idx < len(self._annotations)
+                or self._annotations[idx].page != self._current_page):
+            return QRect()
+        dpr = self._base_pixmap.devicePixelRatio()
+        return annotation_overlay.annotation_bounds(
+            self._annotations[idx],
+            self._base_pixmap.width() / dpr, self._base_pixmap.height() / dpr,
+        )
+
     def _update_display(self):
-        """Compose base + optional preview, push to screen."""
+        """Compose base + optional preview, push to screen.
+
+        Line/arrow/ellipse previews are not baked into a pixmap: the label
+        paints them on top of the base (see ``_paint_shape_preview``), and
+        only the union of the old and new preview rects is repainted.
+        """
         if self._base_pixmap is None:
+            self._ghost_marker.hide()
             return
-        if (self._active_tool in (TOOL_LINE, TOOL_ARROW, TOOL_ELLIPSE, TOOL_RECTCROSS)
-                and self._line_start is not None
-                and self._preview_pos is not None):
-            display = self._base_pixmap.copy()
-            annotation_overlay.draw_preview(
-                display, self._active_tool,
-                self._line_start, self._preview_pos,
+        if self._zoom_settle_timer.isActive():
+            return  # a scaled zoom preview is on screen (see _preview_zoom)
+        if self._render_pending:
+            return  # a stale page is on screen until _finish_render (see _render_page)
+        display = self._base_pixmap
+        if self._page_label.pixmap() is not display:
+            self._page_label.setPixmap(display)
+            dpr = display.devicePixelRatio()
+            self._page_label.resize(
+                int(display.width() / dpr), int(display.height() / dpr)
             )
-        elif (self._active_tool in _POINT_TOOLS
-              and self._hover_pos is not None):
-            display = self._base_pixmap.copy()
-            annotation_overlay.draw_marker_preview(
-                display, self._active_tool, self._hover_pos,
-            )
-        else:
-            display = self._base_pixmap
-        self._page_label.setPixmap(display)
-        dpr = display.devicePixelRatio()
-        self._page_label.resize(
-            int(display.width() / dpr), int(display.height() / dpr)
+        bbox = QRect()
+        if self._shape_preview_active():
+            w, h = _pm_logical_size(self._base_pixmap)
+            bbox = annotation_overlay.preview_bounds(
+                self._active_tool, self._line_start, self._preview_pos, w, h)
+        dirty = bbox.united(self._preview_bbox)
+        self._preview_bbox = bbox
+        if not dirty.isEmpty():
+            self._page_label.update(dirty)
+        self._update_ghost_marker()
+
+    def _update_ghost_marker(self):
+        """Show the point-tool ghost at ``_hover_pos``, or hide it."""
+        if (self._active_tool not in _POINT_TOOLS or self._hover_pos is None
+                or self._base_pixmap is None):
+            self._ghost_marker.hide()
+            return
+        w, h = _pm_logical_size(self._base_pixmap)
+        pm, half = annotation_overlay.marker_ghost(
+            self._active_tool, h, self._base_pixmap.devicePixelRatio())
+        if self._ghost_marker.pixmap().cacheKey() != pm.cacheKey():
+            self._ghost_marker.setPixmap(pm)
+        self._ghost_marker.setGeometry(
+            int(self._hover_pos[0] * w) - half, int(self._hover_pos[1] * h) - half,
+            2 * half, 2 * half,
         )
+        self._ghost_marker.show()
+
+    def _shape_preview_active(self) -> bool:
+        return (self._active_tool in (TOOL_LINE, TOOL_ARROW, TOOL_ELLIPSE, TOOL_RECTCROSS)
+                and self._line_start is not None
+                and self._preview_pos is not None)
+
+    def _paint_shape_preview(self, painter: QPainter):
+        """Overlay painter for ``_page_label``: draw the in-progress shape."""
+        if self._base_pixmap is None or not self._shape_preview_active():
+            return
+        w, h = _pm_logical_size(self._base_pixmap)
+        annotation_overlay.paint_preview(
+            painter, self._active_tool, self._line_start, self._preview_pos, w, h)
 
     # ── Cursor helpers ────────────────────────────────────────────────────────
 
+    def _set_page_cursor(self, shape):
+        """Set the page-label cursor to *shape* (a ``Qt.CursorShape`` or
+        ``_ERASER``), skipping the call when it is already showing."""
+        # The eraser pixmap depends on the screen's DPR, so it is part of the key
+        key = (shape, self.devicePixelRatio()) if shape == _ERASER else shape
+        if key == self._cursor_shape:
+            return
+        self._cursor_shape = key
+        if shape == _ERASER:
+            self._page_label.setCursor(_make_eraser_cursor(key[1]))
+        else:
+            self._page_label.setCursor(shape)
+
     def _update_cursor_for_tool(self):
         """Set the page-label cursor based on the currently active tool."""
         if self._active_tool == TOOL_ERASER:
-            self._page_label.setCursor(_make_eraser_cursor())
+            self._set_page_cursor(_ERASER)
         elif self._active_tool in (TOOL_NONE, None):
-            self._page_label.setCursor(Qt.CursorShape.ArrowCursor)
+            self._set_page_cursor(Qt.CursorShape.ArrowCursor)
         else:
-            self._page_label.setCursor(Qt.CursorShape.CrossCursor)
+            self._set_page_cursor(Qt.CursorShape.CrossCursor)
 
     def _update_hover_cursor(self, fx: float, fy: float):
         """Update cursor shape based on what's under *(fx, fy)* when no tool
         is active (or eraser is active)."""
         # Cmd/Ctrl held → show open-hand to indicate pan-ready, but only when
         # the PDF is actually scrollable (i.e. the page is larger than the view).
-        if QApplication.queryKeyboardModifiers() & _PAN_MOD:
+        if QApplication.keyboardModifiers() & _PAN_MOD:
             hbar = self._scroll.horizontalScrollBar()
             vbar = self._scroll.verticalScrollBar()
             if hbar.maximum() > 0 or vbar.maximum() > 0:
-                self._page_label.setCursor(Qt.CursorShape.OpenHandCursor)
+                self._set_page_cursor(Qt.CursorShape.OpenHandCursor)
                 return
         if self._active_tool == TOOL_ERASER:
-            self._page_label.setCursor(_make_eraser_cursor())
+            self._set_page_cursor(_ERASER)
             w, h = self._page_size()
             idx = annotation_overlay.find_annotation_at(
                 self._annotations, self._current_page, fx, fy, w, h
             )
             if idx != self._eraser_hover_idx:
+                dirty = self._ann_rect(self._eraser_hover_idx).united(self._ann_rect(idx))
                 self._eraser_hover_idx = idx
-                self._rebuild_base_and_display()
+                self._rebuild_base_and_display(dirty)
             return
         if self._active_tool not in (TOOL_NONE, None):
             return  # tool cursor already set by _update_cursor_for_tool
         pm = self._page_label.pixmap()
         if not pm or pm.isNull():
-            self._page_label.setCursor(Qt.CursorShape.ArrowCursor)
+            self._set_page_cursor(Qt.CursorShape.ArrowCursor)
             return
         w, h = _pm_logical_size(pm)
         tol = _DRAG_TOL
         mx, my = fx * w, fy * h
 
+        # One candidate lookup serves both the handle scan and the drag test
+        candidates = self._hit_candidates(mx, my, w, h)
+        hs = max(4, round(annotation_overlay._RESIZE_HANDLE
+                          * h / annotation_overlay.BASE_PAGE_HEIGHT))
+
         # Check for text-resize handle first (horizontal resize cursor)
-        for i in range(len(self._annotations) - 1, -1, -1):
+        for i in candidates:
             ann = self._annotations[i]
-            if ann.page != self._current_page:
-                continue
             if ann.type == "text":
                 rect = annotation_overlay.get_text_box_rect(ann, w, h)
                 if rect is None:
                     continue
-                hs = max(4, round(annotation_overlay._RESIZE_HANDLE
-                                  * h / annotation_overlay.BASE_PAGE_HEIGHT))
                 if (rect.right() - hs <= mx <= rect.right() + 4
                         and rect.bottom() - hs <= my <= rect.bottom() + 4):
-                    self._page_label.setCursor(Qt.CursorShape.SizeHorCursor)
+                    self._set_page_cursor(Qt.CursorShape.SizeHorCursor)
                     return
 
         # Check if hovering over any draggable annotation
-        drag = self._find_drag_target(fx, fy)
+        drag = self._find_drag_target(fx, fy, candidates)
         if drag is not None:
             # Handle-specific cursors (endpoints, resize handles)
             if drag.kind in ("line-start", "line-end",
@@ -902,11 +1488,11 @@ class PDFViewerPanel(QWidget):
                              "ellipse-bottom", "ellipse-left",
                              "rectcross-tl", "rectcross-tr",
                              "rectcross-bl", "rectcross-br"):
-                self._page_label.setCursor(Qt.CursorShape.SizeAllCursor)
+                self._set_page_cursor(Qt.CursorShape.SizeAllCursor)
             else:
-                self._page_label.setCursor(Qt.CursorShape.OpenHandCursor)
+                self._set_page_cursor(Qt.CursorShape.OpenHandCursor)
             return
-        self._page_label.setCursor(Qt.CursorShape.ArrowCursor)
+        self._set_page_cursor(Qt.CursorShape.ArrowCursor)
 
     def _refresh_cursor_at_mouse(self):
         """Recompute the page-label cursor using the current mouse position.
@@ -927,24 +1513,26 @@ class PDFViewerPanel(QWidget):
     # ── Mouse handlers ────────────────────────────────────────────────────────
 
     def _on_page_pressed(self, fx: float, fy: float):
+        if self._render_pending:
+            return  # still showing the previous page's image
         self._drag_moved = False
         # Cmd/Ctrl + left-click → start panning (only when scrollable)
-        if QApplication.queryKeyboardModifiers() & _PAN_MOD:
+        if QApplication.keyboardModifiers() & _PAN_MOD:
             hbar = self._scroll.horizontalScrollBar()
             vbar = self._scroll.verticalScrollBar()
             if hbar.maximum() > 0 or vbar.maximum() > 0:
                 vp = self._scroll.viewport()
-                cur = vp.mapFromGlobal(QCursor.pos())
+                cur = vp.mapFromGlobal(self._page_label.last_global_pos)
                 self._pan_origin = (cur.x(), cur.y())
                 self._pan_hval = hbar.value()
                 self._pan_vval = vbar.value()
-                self._page_label.setCursor(Qt.CursorShape.ClosedHandCursor)
+                self._set_page_cursor(Qt.CursorShape.ClosedHandCursor)
             return
         if self._active_tool in (TOOL_NONE, None):
             drag = self._find_drag_target(fx, fy)
             if drag is not None:
                 self._drag = drag
-                self._page_label.setCursor(Qt.CursorShape.ClosedHandCursor)
+                self._set_page_cursor(Qt.CursorShape.ClosedHandCursor)
                 return
         self._handle_click(fx, fy)
 
@@ -952,7 +1540,7 @@ class PDFViewerPanel(QWidget):
         # Active pan — use raw viewport pixel coordinates to avoid clamping jitter
         if self._pan_origin is not None:
             vp = self._scroll.viewport()
-            cur = vp.mapFromGlobal(QCursor.pos())
+            cur = vp.mapFromGlobal(self._page_label.last_global_pos)
             dx = cur.x() - self._pan_origin[0]
             dy = cur.y() - self._pan_origin[1]
             self._scroll.horizontalScrollBar().setValue(int(self._pan_hval - dx))
@@ -975,6 +1563,11 @@ class PDFViewerPanel(QWidget):
         # Update cursor based on what's under the mouse
         self._update_hover_cursor(fx, fy)
 
+    def _on_page_left(self):
+        if self._hover_pos is not None:
+            self._hover_pos = None
+            self._update_ghost_marker()
+
     def _on_page_released(self, fx: float, fy: float):
         # End pan
         if self._pan_origin is not None:
@@ -985,7 +1578,6 @@ class PDFViewerPanel(QWidget):
             self._apply_drag(fx, fy)
             self._drag = None
             if self._drag_moved:
-                self._rebuild_base_and_display()
                 self.annotations_changed.emit()
             self._update_hover_cursor(fx, fy)
 
@@ -1001,9 +1593,11 @@ class PDFViewerPanel(QWidget):
                 self._annotations, self._current_page, fx, fy, w, h
             )
             if idx >= 0:
+                dirty = self._ann_rect(idx).united(self._ann_rect(self._eraser_hover_idx))
                 self._annotations.pop(idx)
+                self._ann_version += 1
                 self._eraser_hover_idx = -1
-                self._rebuild_base_and_display()
+                self._rebuild_base_and_display(dirty)
                 self.annotations_changed.emit()
                 self.deselect_tool()
 
@@ -1033,7 +1627,8 @@ class PDFViewerPanel(QWidget):
                     type=self._active_tool,
                     x=x1, y=y1, x2=x2, y2=y2,
                 ))
-                self._rebuild_base_and_display()
+                self._ann_version += 1
+                self._rebuild_base_and_display(self._ann_rect(len(self._annotations) - 1))
                 self.annotations_changed.emit()
                 self.deselect_tool()
 
@@ -1046,7 +1641,8 @@ class PDFViewerPanel(QWidget):
                 type=self._active_tool,
                 x=fx, y=fy,
             ))
-            self._rebuild_base_and_display()
+            self._ann_version += 1
+            self._rebuild_base_and_display(self._ann_rect(len(self._annotations) - 1))
             self.annotations_changed.emit()
             self.deselect_tool()
 
@@ -1056,7 +1652,7 @@ class PDFViewerPanel(QWidget):
         """Double-clicking a text annotation opens it for editing."""
         # Only handle when no shape-drawing tool is active (text tool already
         # handles editing on single-click).
-        if self._active_tool not in (TOOL_NONE, None):
+        if self._active_tool not in (TOOL_NONE, None) or self._render_pending:
             return
         pm = self._page_label.pixmap()
         if not pm or pm.isNull():
@@ -1074,6 +1670,7 @@ class PDFViewerPanel(QWidget):
         if d is None:
             return
         ann = self._annotations[d.index]
+        old_rect = self._ann_rect(d.index)
         dx, dy = fx - d.start_fx, fy - d.start_fy
 
         def cl(v):
@@ -1135,21 +1732,23 @@ class PDFViewerPanel(QWidget):
             ann.x2 = cl(d.orig_x2 + dx)
             ann.y2 = cl(d.orig_y2 + dy)
 
-        self._rebuild_base_and_display()
+        self._ann_version += 1
+        self._rebuild_base_and_display(old_rect.united(self._ann_rect(d.index)))
 
-    def _find_drag_target(self, fx: float, fy: float) -> Optional[_DragState]:
+    def _find_drag_target(self, fx: float, fy: float,
+                          candidates: Optional[List[int]] = None) -> Optional[_DragState]:
         pm = self._page_label.pixmap()
         if not pm or pm.isNull():
             return None
         w, h = _pm_logical_size(pm)
         tol = _DRAG_TOL
         mx, my = fx * w, fy * h
+        if candidates is None:
+            candidates = self._hit_candidates(mx, my, w, h)
 
-        # Iterate in reverse so the topmost (last-drawn) annotation wins
-        for i in range(len(self._annotations) - 1, -1, -1):
+        # Candidates come topmost (last-drawn) first, so that one wins
+        for i in candidates:
             ann = self._annotations[i]
-            if ann.page != self._current_page:
-                continue
 
             if ann.type in ("line", "arrow") and ann.x2 is not None:
                 x1, y1 = ann.x * w, ann.y * h
@@ -1241,8 +1840,9 @@ class PDFViewerPanel(QWidget):
         return None
 
     def _find_text_at(self, fx: float, fy: float, w: int, h: int) -> int:
-        for i, ann in enumerate(self._annotations):
-            if ann.page != self._current_page or ann.type != "text":
+        for i in reversed(self._hit_candidates(fx * w, fy * h, w, h)):
+            ann = self._annotations[i]
+            if ann.type != "text":
                 continue
             rect = annotation_overlay.get_text_box_rect(ann, w, h)
             if rect and rect.contains(int(fx * w), int(fy * h)):
@@ -1261,7 +1861,7 @@ class PDFViewerPanel(QWidget):
         # behind the inline editor.
         self._editing_ann_idx = edit_idx
         if edit_idx >= 0:
-            self._rebuild_base_and_display()
+            self._rebuild_base_and_display(self._ann_rect(edit_idx))
 
         # Scale font to match the rendered annotation size
         lw, lh = _pm_logical_size(pm)
@@ -1310,17 +1910,20 @@ class PDFViewerPanel(QWidget):
                         x=fx, y=fy, text=text.strip(),
                         width=width_frac,
                     ))
-                self._rebuild_base_and_display()
+                self._ann_version += 1
+                # The edited annotation was hidden, so only its new box changes
+                idx = edit_idx if edit_idx >= 0 else len(self._annotations) - 1
+                self._rebuild_base_and_display(self._ann_rect(idx))
                 self.annotations_changed.emit()
             else:
-                self._rebuild_base_and_display()
+                self._rebuild_base_and_display(self._ann_rect(edit_idx))
             self.deselect_tool()
 
         def _cancel():
             self._inline_editor = None
             self._editing_ann_idx = -1
             editor.deleteLater()
-            self._rebuild_base_and_display()
+            self._rebuild_base_and_display(self._ann_rect(edit_idx))
 
         editor.committed.connect(_commit)
         editor.cancelled.connect(_cancel)
@@ -1330,8 +1933,8 @@ class PDFViewerPanel(QWidget):
             self._inline_editor.deleteLater()
             self._inline_editor = None
             if self._editing_ann_idx >= 0:
-                self._editing_ann_idx = -1
-                self._rebuild_base_and_display()
+                idx, self._editing_ann_idx = self._editing_ann_idx, -1
+                self._rebuild_base_and_display(self._ann_rect(idx))
 
     # ── Stamp popup (preset text annotation picker) ──────────────────────────
 
@@ -1360,101 +1963,62 @@ class PDFViewerPanel(QWidget):
         filter_edit.setStyleSheet("QLineEdit { border: 1px solid #ccc; }")
         playout.addWidget(filter_edit)
 
-        preset_list = QListWidget()
+        # Filtering goes through a proxy model so a keystroke only re-filters
+        # the string list instead of hiding/showing one widget item per preset.
+        preset_model = QStringListModel(list(self._preset_annotations), popup)
+        preset_proxy = QSortFilterProxyModel(popup)
+        preset_proxy.setSourceModel(preset_model)
+        preset_proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        preset_list = QListView()
+        preset_list.setModel(preset_proxy)
+        preset_list.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         preset_list.setStyleSheet(
-            "QListWidget { border: none; }"
-            "QListWidget::item { padding: 3px; }"
-            "QListWidget::item:hover { background: #e0e8f0; }"
+            "QListView { border: none; }"
+            "QListView::item { padding: 3px; }"
+            "QListView::item:hover { background: #e0e8f0; }"
         )
-        for text in self._preset_annotations:
-            preset_list.addItem(QListWidgetItem(text))
         playout.addWidget(preset_list)
 
-        def _first_visible_item():
-            for i in range(preset_list.count()):
-                item = preset_list.item(i)
-                if not item.isHidden():
-                    return item
-            return None
+        def _first_visible_item() -> QModelIndex:
+            return preset_proxy.index(0, 0)
 
         def _filter_presets(query: str):
-            q = query.strip().lower()
-            for i in range(preset_list.count()):
-                item = preset_list.item(i)
-                item.setHidden(q != "" and q not in item.text().lower())
+            preset_proxy.setFilterFixedString(query.strip())
             # Keep the first visible item selected so Enter always picks something
             first = _first_visible_item()
-            if first:
-                preset_list.setCurrentItem(first)
+            if first.isValid():
+                preset_list.setCurrentIndex(first)
             else:
                 preset_list.clearSelection()
 
         filter_edit.textChanged.connect(_filter_presets)
 
-        def _on_pick(item: QListWidgetItem):
-            if item is None or item.isHidden():
+        def _on_pick(index: QModelIndex):
+            if not index.isValid():
                 return
-            text = item.text()
+            text = index.data(Qt.ItemDataRole.DisplayRole)
             self._close_stamp_popup()
             self._annotations.append(Annotation(
                 page=self._current_page, type="text",
                 x=fx, y=fy, text=text,
             ))
-            self._rebuild_base_and_display()
+            self._ann_version += 1
+            self._rebuild_base_and_display(self._ann_rect(len(self._annotations) - 1))
             self.annotations_changed.emit()
             self.deselect_tool()
 
-        preset_list.itemClicked.connect(_on_pick)
-        preset_list.itemActivated.connect(_on_pick)
+        preset_list.clicked.connect(_on_pick)
+        preset_list.activated.connect(_on_pick)
 
-        _filter_orig_kp = filter_edit.keyPressEvent
-        _list_orig_kp   = preset_list.keyPressEvent
-
-        def _filter_key_press(event):
-            key = event.key()
-            if key in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
-                # Pick the first visible / currently selected item
-                item = preset_list.currentItem() or _first_visible_item()
-                if item and not item.isHidden():
-                    _on_pick(item)
-                return
-            if key == Qt.Key.Key_Down:
-                # Move selection focus to the list
-                first = _first_visible_item()
-                if first:
-                    preset_list.setCurrentItem(first)
-                    preset_list.setFocus()
-                return
-            if key == Qt.Key.Key_Escape:
-                self._close_stamp_popup()
-                return
-            _filter_orig_kp(event)
-
-        filter_edit.keyPressEvent = _filter_key_press
-
-        def _list_key_press(event):
-            key = event.key()
-            if key in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
-                item = preset_list.currentItem()
-                if item and not item.isHidden():
-                    _on_pick(item)
-                return
-            if key == Qt.Key.Key_Up:
-                # Return focus to filter when Up is pressed on the first visible item
-                if preset_list.currentItem() is _first_visible_item():
-                    filter_edit.setFocus()
-                    return
-            if key == Qt.Key.Key_Escape:
-                self._close_stamp_popup()
-                return
-            _list_orig_kp(event)
-
-        preset_list.keyPressEvent = _list_key_press
+        keys = _StampPopupKeys(filter_edit, preset_list, _on_pick,
+                               self._close_stamp_popup, popup)
+        filter_edit.installEventFilter(keys)
+        preset_list.installEventFilter(keys)
 
         # Select the first item by default so Enter works immediately
         first = _first_visible_item()
-        if first:
-            preset_list.setCurrentItem(first)
+        if first.isValid():
+            preset_list.setCurrentIndex(first)
 
         edit_btn = QPushButton("Edit Presets…")
         edit_btn.setStyleSheet("QPushButton { border: 1px solid #ccc; padding: 3px; }")
@@ -1506,13 +2070,13 @@ class PDFViewerPanel(QWidget):
                 if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
                     delta = event.angleDelta().y()
                     if delta:
-                        self._apply_zoom_factor(1.0 + delta / _WHEEL_ZOOM_DIVISOR)
+                        self._preview_zoom(self._zoom * (1.0 + delta / _WHEEL_ZOOM_DIVISOR))
                     return True
             # Native pinch gesture → zoom (macOS trackpad)
             elif t == QEvent.Type.NativeGesture:
                 if (event.gestureType()
                         == Qt.NativeGestureType.ZoomNativeGesture):
-                    self._apply_zoom_factor(1.0 + event.value())
+                    self._preview_zoom(self._zoom * (1.0 + event.value()))
                     return True
         return super().eventFilter(obj, event)
 
@@ -1524,9 +2088,50 @@ class PDFViewerPanel(QWidget):
             self._invalidate_cache()
             self._render_page()
 
-    def _apply_zoom_factor(self, factor: float):
-        """Multiply current zoom by *factor*."""
-        self._apply_zoom(self._zoom * factor)
+    def _preview_zoom(self, new_zoom: float):
+        """Zoom for continuous input (wheel / pinch).
+
+        Instead of rasterising every intermediate step, the current page is
+        shown scaled from its existing pixmap, and the real render happens
+        once no zoom input arrived for ``_ZOOM_SETTLE_MS``.
+        """
+        new_zoom = max(0.5, min(3.0, new_zoom))
+        if abs(new_zoom - self._zoom) <= 0.005:
+            return
+        self._zoom = new_zoom
+        self._zoom_label.setText(f"{int(self._zoom * 100)}%")
+        if self._base_pixmap is None or self._raw_pixmap is None or self._raw_zoom <= 0:
+            self._settle_zoom()
+            return
+        self._render_pending = True  # ignore clicks until the real render
+        self._zoom_settle_timer.start()
+        # A fast wheel or pinch delivers several events per frame; scale the
+        # preview once per event-loop pass, at the latest zoom.
+        if not self._zoom_preview_pending:
+            self._zoom_preview_pending = True
+            QTimer.singleShot(0, self._show_zoom_preview)
+
+    def _show_zoom_preview(self):
+        self._zoom_preview_pending = False
+        base = self._base_pixmap
+        if not self._zoom_settle_timer.isActive() or base is None or self._raw_zoom <= 0:
+            return  # already settled, or the page changed meanwhile
+        ratio = self._zoom / self._raw_zoom
+        scaled = base.scaled(
+            max(1, round(base.width() * ratio)), max(1, round(base.height() * ratio)),
+            Qt.AspectRatioMode.IgnoreAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+        scaled.setDevicePixelRatio(base.devicePixelRatio())
+        self._page_label.setPixmap(scaled)
+        w, h = _pm_logical_size(scaled)
+        self._page_label.resize(w, h)
+        self._ghost_marker.hide()
+
+    def _settle_zoom(self):
+        """Rasterise at the zoom level reached by ``_preview_zoom``."""
+        self._invalidate_cache()
+        self._render_page()
 
     def _zoom_in(self):
         self._apply_zoom(self._zoom + 0.2)
@@ -25,6 +25,7 @@ from PySide6.QtWidgets import (
     QListWidgetItem,
     QMessageBox,
     QPushButton,
+    QSpinBox,
     QTabWidget,
     QTreeWidget,
     QTreeWidgetItem,
@@ -34,6 +35,8 @@ from PySide6.QtWidgets import (
 
 from models import Exercise, GradingScheme, GradingSettings, Subquestion
 
+import data_store
+
 _MIN_ROUNDING = 0.01   # smallest allowed rounding step in the dialog
 
 
@@ -266,6 +269,25 @@ class SettingsDialog(QDialog):
 
         layout.addSpacing(12)
 
+        cache_form = QFormLayout()
+        cache_form.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.FieldsStayAtSizeHint)
+        self._page_cache_spin = QSpinBox()
+        self._page_cache_spin.setRange(data_store.PAGE_CACHE_MB_MIN,
+                                       data_store.PAGE_CACHE_MB_MAX)
+        self._page_cache_spin.setSingleStep(16)
+        self._page_cache_spin.setSuffix(" MB")
+        self._page_cache_spin.setValue(settings.page_cache_mb)
+        self._page_cache_spin.setToolTip(
+            "Memory kept for already-rendered PDF pages.  Least recently\n"
+            "viewed pages are dropped first when the budget is exceeded.\n"
+            f"Rendered pages are also kept on disk in the user cache folder\n"
+            f"(up to {data_store.PAGE_CACHE_MAX_BYTES // (1024 * 1024)} MB)."
+        )
+        cache_form.addRow("Page cache size:", self._page_cache_spin)
+        layout.addLayout(cache_form)
+
+        layout.addSpacing(12)
+
         self._separate_window_cb = QCheckBox("Grading sheet in separate window")
         self._separate_window_cb.setChecked(settings.grading_separate_window)
         layout.addWidget(self._separate_window_cb)
@@ -654,6 +676,7 @@ class SettingsDialog(QDialog):
             debug_mode=self._debug_cb.isChecked(),
             cover_page_detail=self._cover_detail_cb.isChecked(),
             hi_dpr=self._hi_dpr_cb.isChecked(),
+            page_cache_mb=self._page_cache_spin.value(),
             grading_separate_window=self._separate_window_cb.isChecked(),
             show_extra_fields=self._show_extra_cb.isChecked(),
             compact_table=self._compact_table_cb.isChecked(),